@@ -1,6 +1,15 @@
+from sigtech.api.client.async_client import AsyncClient
 from sigtech.api.client.client import Client
+from sigtech.api.client.polling import PollingPolicy
+from sigtech.api.client.transport import TransportSettings
 from sigtech.api.framework import config
+from sigtech.api.framework.disk_cache import DiskCache
 from sigtech.api.framework.environment import env, init, obj
+from sigtech.api.framework.framework_api_object import (
+    gather,
+    prefetch_reference_data,
+)
+from sigtech.api.framework.history_store import HistoryStore
 from sigtech.api.framework.indices.tradable_index import TradableTSIndex
 from sigtech.api.framework.instruments.fx_otc import FXForward
 from sigtech.api.framework.instruments.ir_otc import InterestRateSwap
@@ -36,7 +45,12 @@ from sigtech.api.framework.strategies.rolling_swap_strategy import RollingSwapSt
 from sigtech.api.framework.strategies.signal_strategy import SignalStrategy
 
 __all__ = [
+    "AsyncClient",
     "Client",
+    "DiskCache",
+    "HistoryStore",
+    "PollingPolicy",
+    "TransportSettings",
     "SignalStrategy",
     "BasketStrategy",
     "ReinvestmentStrategy",
@@ -57,8 +71,10 @@ __all__ = [
     "StraddleOptionStrategy",
     "RollingStraddleOptionStrategy",
     "env",
+    "gather",
     "get_single_stock_strategy",
     "init",
     "obj",
+    "prefetch_reference_data",
     "config",
 ]
@@ -0,0 +1,389 @@
+import asyncio
+import logging
+import os
+import time
+import urllib.parse
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from sigtech.api.client.polling import (
+    DEFAULT_POLLING_POLICY,
+    PollingPolicy,
+    is_resolved,
+)
+from sigtech.api.client.response import Response, raise_if_failed
+from sigtech.api.client.utils import singular, snake_to_camel
+from sigtech.api.version import __version__
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse(Response):
+    """
+    Response of an ``AsyncClient``, whose object queries are coroutines.
+    """
+
+    client: Optional["AsyncClient"]  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        d: Dict[str, Any],
+        name="Response",
+        client: Optional["AsyncClient"] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize AsyncResponse class to hold API response data.
+
+        :param d: Input dictionary from API response.
+        :param name: Name of the API response, (optional) defaults to 'Response'.
+        :param client: Async API client instance, (optional) defaults to None.
+        :param kwargs: Additional arguments, (optional) defaults to None.
+        """
+        super().__init__(d, name=name, kwargs=kwargs)
+        self.client = client
+
+    async def latest_object_response(self) -> Response:
+        """
+        Query the latest object status response from the client.
+
+        :return: The latest object response.
+        """
+        if (
+            not self.kwargs
+            or "session_id" not in self.kwargs
+            or "object_id" not in self.d
+        ):
+            raise ValueError("Both 'session_id' and 'object_id' must be present.")
+        assert self.client is not None
+        return await self.client.query_object(self.kwargs["session_id"], self.object_id)
+
+    async def wait_for_object_status(
+        self,
+        property_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        polling_policy: Optional[PollingPolicy] = None,
+    ) -> Response:
+        """
+        Wait for the object status to be in a final state or a property to be available.
+
+        :param property_name: The name of the property to wait for.
+            (optional; waits for final state if `None`).
+        :param timeout: The maximum amount of time to wait.
+            (optional; defaults to client settings).
+        :param polling_policy: The polling schedule to use.
+            (optional; defaults to client settings).
+        :return: The response data for the final object status.
+        """
+        if (
+            not self.kwargs
+            or "session_id" not in self.kwargs
+            or "object_id" not in self.d
+        ):
+            raise ValueError("Both 'session_id' and 'object_id' must be present.")
+        if property_name is not None and property_name in self.__dict__:
+            return self
+        if self.d.get("status") == "SUCCEEDED":
+            return self
+
+        session_id = self.kwargs["session_id"]
+        assert self.client is not None
+        response = await self.client.wait_for_object_status(
+            session_id,
+            self.object_id,
+            property_name=property_name,
+            timeout=timeout,
+            polling_policy=polling_policy,
+        )
+        raise_if_failed(response, session_id, self.object_id)
+        return response
+
+
+class _AsyncTransport:
+    """
+    Lazily created ``aiohttp`` session shared by an ``AsyncClient`` and all of
+    its child clients.
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        session: Optional["ClientSession"] = None,
+        pool_size: int = 100,
+    ):
+        self._headers = headers
+        self._session = session
+        self._owns_session = session is None
+        self._pool_size = pool_size
+
+    @property
+    def session(self) -> "ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=aiohttp.TCPConnector(limit=self._pool_size),
+            )
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+
+
+class AsyncClient:
+    """
+    Asyncio counterpart of :class:`sigtech.api.client.client.Client`.
+
+    All requests are coroutines sharing one pooled ``aiohttp`` session, and
+    return ``AsyncResponse`` objects: ``Response`` objects whose object queries
+    are coroutines as well.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        url: Optional[str] = None,
+        session: Optional["ClientSession"] = None,
+        _base_url: Optional[str] = None,
+        wait_timeout: Optional[int] = 300,
+        polling_policy: Optional[PollingPolicy] = None,
+        pool_size: int = 100,
+        _transport: Optional[_AsyncTransport] = None,
+    ):
+        """
+        Initialize an AsyncClient object.
+
+        :param api_key: The API key for SigTech. Defaults to None.
+        :param url: The URL of the API. Defaults to None.
+        :param session: An ``aiohttp.ClientSession`` to use. Defaults to None.
+        :param _base_url: The base URL of the API. Defaults to None.
+        :param wait_timeout: Timeout for waiting for final object status in seconds.
+            Defaults to 300 seconds.
+        :param polling_policy: Polling schedule used while waiting for objects.
+            Defaults to ``DEFAULT_POLLING_POLICY``.
+        :param pool_size: Maximum number of pooled connections. Defaults to 100.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncClient requires aiohttp. Install it with"
+                " `pip install sigtech[async]`."
+            )
+        self._url: str = (
+            url
+            if url is not None
+            else os.environ.get("SIGTECH_API_URL", "https://api.sigtech.com")
+        )
+        self._base_url = _base_url or self._url
+        self._api_key = api_key or os.environ.get("SIGTECH_API_KEY", "")
+
+        if self._api_key == "":
+            raise ValueError("Please provide a SigTech API key.")
+
+        self._transport = _transport or _AsyncTransport(
+            {
+                "Authorization": f"Bearer {self._api_key}",
+                "Sig-Version": __version__,
+                "User-Agent": f"SDK-Python/{__version__}",
+            },
+            session=session,
+            pool_size=pool_size,
+        )
+
+        self.wait_timeout = wait_timeout
+        self.polling_policy = polling_policy or DEFAULT_POLLING_POLICY
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying connection pool.
+        """
+        await self._transport.close()
+
+    @property
+    def namespace(self) -> str:
+        """
+        Returns the namespace of the AsyncClient.
+
+        :return: The namespace.
+        """
+        return self._url.split("/")[-1]
+
+    async def _request(self, method: str, url: str, **kwargs) -> Any:
+        logger.debug(f"{method} {url}")
+        async with self._transport.session.request(method, url, **kwargs) as resp:
+            ok_statuses = (200, 202) if method == "POST" else (200,)
+            if resp.status not in ok_statuses:
+                logger.error(f"API REQUEST ERROR - {await resp.text()}")
+                resp.raise_for_status()
+            return await resp.json(content_type=None)
+
+    async def create(self, **kwargs) -> AsyncResponse:
+        """
+        Create a new resource.
+
+        :param kwargs: The arguments for creating a resource.
+        :return: A Response object representing the result.
+        """
+        obj = {snake_to_camel(k): v for (k, v) in kwargs.items()}
+        d = await self._request("POST", self._url, json=obj)
+        return AsyncResponse(
+            d, name=singular(self.namespace), client=self, kwargs=kwargs
+        )
+
+    async def list(self, **kwargs) -> List[AsyncResponse]:
+        """
+        List all resources.
+
+        :return: A list of Response objects representing the resources.
+        """
+        d = await self._request("GET", _with_query(self._url, kwargs))
+        return [
+            AsyncResponse(o, name=singular(self.namespace)) for o in d[self.namespace]
+        ]
+
+    async def get(self, resource_id: Optional[str] = "", **kwargs) -> AsyncResponse:
+        """
+        Get a specific resource.
+
+        :param resource_id: The ID of the resource. Defaults to ''.
+        :param kwargs: The arguments for getting a resource.
+        :return: A Response object representing the resource.
+        """
+        url = f"{self._url}/{resource_id}".rstrip("/")
+        d = await self._request("GET", _with_query(url, kwargs))
+        return AsyncResponse(d, name=singular(self.namespace), client=self)
+
+    async def delete(self, resource_id: str) -> AsyncResponse:
+        """
+        Delete an existing resource.
+
+        :param resource_id: The ID of the resource to delete.
+        :return: A Response object representing the result.
+        """
+        url = f"{self._url}/{resource_id}".rstrip("/")
+        d = await self._request("DELETE", url)
+        return AsyncResponse(d, name=singular(self.namespace), client=self)
+
+    async def query_object(self, session_id: str, object_id: str) -> AsyncResponse:
+        """
+        Query a specific object in a session.
+
+        :param session_id: The ID of the session.
+        :param object_id: The ID of the object.
+        :return: A Response object representing the object.
+        """
+        return await self.with_path(f"sessions/{session_id}/objects/{object_id}").get()
+
+    async def wait_for_object_status(
+        self,
+        session_id: str,
+        object_id: str,
+        property_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        polling_policy: Optional[PollingPolicy] = None,
+    ) -> Response:
+        """
+        Wait for a specific object in a session to reach a final status
+        or to contain a property.
+
+        :param session_id: The ID of the session.
+        :param object_id: The ID of the object.
+        :param property_name: The property to wait for. Defaults to None.
+        :param timeout: The maximum time to wait in seconds. Defaults to None.
+        :param polling_policy: Polling schedule for this call.
+            Defaults to the client policy.
+        :return: A Response object representing the object.
+        """
+        policy = polling_policy or self.polling_policy
+        deadline = timeout or policy.deadline or self.wait_timeout
+        assert deadline is not None
+        t0: float = time.monotonic()
+        attempt = 0
+
+        while True:
+            resp = await self.query_object(session_id, object_id)
+
+            if is_resolved(resp, property_name):
+                if resp.d.get("status") == "FAILED":
+                    logger.debug(f"FAILED TASK {str(resp)}")
+                return resp
+
+            elapsed = time.monotonic() - t0
+            if elapsed > deadline:
+                raise TimeoutError(f"Timeout waiting for object_id={object_id}")
+
+            await asyncio.sleep(
+                min(policy.delay(attempt), max(0.0, deadline - elapsed))
+            )
+            attempt += 1
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in _INHERITED_SETTINGS:
+            # Children are created again, with the new settings.
+            self.__dict__.get("_children", {}).clear()
+
+    def __getattr__(self, item: str) -> "AsyncClient":
+        """
+        Get an attribute of the AsyncClient.
+
+        :param item: The name of the attribute.
+        :return: The attribute.
+        """
+        if item.startswith("__") or "_url" not in self.__dict__:
+            raise AttributeError(item)
+        item = item.replace("_", "-")
+        return self._child(f"{self._url}/{item}")
+
+    def with_path(self, resource_path: str) -> "AsyncClient":
+        """
+        Get an AsyncClient instance with a given resource path.
+
+        :param resource_path: The resource path to append to the base url.
+        :return: The attribute.
+        """
+        return self._child(f"{self._base_url}/{resource_path.lstrip('/').rstrip('/')}")
+
+    def _child(self, url: str) -> "AsyncClient":
+        """
+        Client of a resource, sharing the transport and settings of this client.
+        Children are cached per URL.
+        """
+        children = self.__dict__.setdefault("_children", {})
+        child = children.get(url)
+        if child is None:
+            child = AsyncClient(
+                self._api_key,
+                url,
+                _base_url=self._base_url,
+                wait_timeout=self.wait_timeout,
+                polling_policy=self.polling_policy,
+                _transport=self._transport,
+            )
+            child = children.setdefault(url, child)
+        return child
+
+
+# Settings of an AsyncClient that are inherited by its children
+_INHERITED_SETTINGS = frozenset(["wait_timeout", "polling_policy"])
+
+
+def _with_query(url: str, kwargs: Dict[str, Any]) -> str:
+    if kwargs:
+        d = {snake_to_camel(k): v for (k, v) in kwargs.items()}
+        url += f"?{urllib.parse.urlencode(d)}"
+    return url
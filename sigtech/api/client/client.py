@@ -1,12 +1,29 @@
+import gzip
+import json
 import logging
 import os
 import time
 import urllib.parse
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import requests
 
+from sigtech.api.client.columnar import (
+    accept_header,
+    decode_arrow,
+    is_arrow_response,
+)
+from sigtech.api.client.polling import (
+    DEFAULT_POLLING_POLICY,
+    PollingPolicy,
+    is_resolved,
+)
 from sigtech.api.client.response import Response
+from sigtech.api.client.single_flight import SingleFlight
+from sigtech.api.client.transport import (
+    DEFAULT_TRANSPORT_SETTINGS,
+    TransportSettings,
+)
 from sigtech.api.client.utils import singular, snake_to_camel
 from sigtech.api.version import __version__
 
@@ -25,6 +42,11 @@ class Client:
         session: Optional[requests.Session] = None,
         _base_url: Optional[str] = None,
         wait_timeout: Optional[int] = 300,
+        polling_policy: Optional[PollingPolicy] = None,
+        columnar: bool = True,
+        transport: Optional[TransportSettings] = None,
+        status_ttl: float = 0.0,
+        compress_requests: Optional[int] = 64 * 1024,
     ):
         """
         Initialize a Client object.
@@ -35,6 +57,20 @@ class Client:
         :param _base_url: The base URL of the API. Defaults to None.
         :param wait_timeout: Timeout for waiting for final object status in seconds.
             Defaults to 300 seconds.
+        :param polling_policy: Polling schedule used while waiting for objects.
+            Defaults to ``DEFAULT_POLLING_POLICY``.
+        :param columnar: Request tabular data as Arrow IPC, when pyarrow is
+            installed, falling back to JSON. Defaults to True.
+        :param transport: Connection pool, timeout and retry settings.
+            Defaults to ``DEFAULT_TRANSPORT_SETTINGS``. Only applied to the
+            session if no session is given.
+        :param status_ttl: Time in seconds an object status returned by
+            ``query_object`` is reused by other queries of the same object.
+            Defaults to 0 (not reused).
+        :param compress_requests: Minimum size in bytes of request bodies that
+            are sent gzip compressed, or None to never compress. Resources that
+            reject compressed bodies are sent uncompressed bodies.
+            Defaults to 64 KiB.
         """
         self._url: str = (
             url
@@ -47,7 +83,11 @@ class Client:
         if self._api_key == "":
             raise ValueError("Please provide a SigTech API key.")
 
-        self._session = session or requests.Session()
+        self.transport = transport or DEFAULT_TRANSPORT_SETTINGS
+        if session is None:
+            session = requests.Session()
+            self.transport.mount(session)
+        self._session = session
         self._session.headers.update(
             {
                 "Authorization": f"Bearer {self._api_key}",
@@ -57,6 +97,25 @@ class Client:
         )
 
         self.wait_timeout = wait_timeout
+        self.polling_policy = polling_policy or DEFAULT_POLLING_POLICY
+        self.columnar = columnar
+        self.status_ttl = status_ttl
+        self.compress_requests = compress_requests
+        self._gzip_requests = True
+        self._single_flight = SingleFlight()
+        self._object_url = (
+            f"{self._base_url}/sessions/{{session_id}}/objects/{{object_id}}"
+        )
+        self._children: Dict[str, Client] = {}
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the resource URL of the Client.
+
+        :return: The URL.
+        """
+        return self._url
 
     @property
     def namespace(self) -> str:
@@ -75,8 +134,9 @@ class Client:
         :return: A Response object representing the result.
         """
         obj = {snake_to_camel(k): v for (k, v) in kwargs.items()}
-        logger.debug(f"POST {self._url} {obj}")
-        resp = self._session.post(self._url, json=obj)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"POST {self._url} {obj}")
+        resp = self._post_json(obj)
         if resp.status_code not in (200, 202):
             logger.error(f"API REQUEST ERROR - {resp.text}")
             resp.raise_for_status()
@@ -84,6 +144,31 @@ class Client:
             resp.json(), name=singular(self.namespace), client=self, kwargs=kwargs
         )
 
+    def _post_json(self, obj: dict) -> requests.Response:
+        try:
+            body = json.dumps(obj, allow_nan=False).encode("utf-8")
+        except ValueError as e:
+            # Same error as ``requests`` for values which are not valid JSON,
+            # e.g. NaN.
+            raise requests.exceptions.InvalidJSONError(e)
+        headers = {"Content-Type": "application/json"}
+        threshold = self.compress_requests
+        if threshold is not None and len(body) >= threshold and self._gzip_requests:
+            resp = self._session.post(
+                self._url,
+                data=gzip.compress(body, compresslevel=5),
+                headers={**headers, "Content-Encoding": "gzip"},
+                timeout=self.transport.timeout,
+            )
+            if not _rejects_gzip(resp):
+                return resp
+            # Compressed request bodies are not supported by this resource.
+            logger.debug(f"Compressed request rejected by {self._url}: {resp.text}")
+            self.__dict__["_gzip_requests"] = False
+        return self._session.post(
+            self._url, data=body, headers=headers, timeout=self.transport.timeout
+        )
+
     def list(self, **kwargs) -> List[Response]:
         """
         List all resources.
@@ -95,7 +180,7 @@ class Client:
             d = {snake_to_camel(k): v for (k, v) in kwargs.items()}
             url += f"?{urllib.parse.urlencode(d)}"
         logger.debug(f"GET {url}")
-        resp = self._session.get(url)
+        resp = self._session.get(url, timeout=self.transport.timeout)
 
         if resp.status_code != 200:
             logger.error(f"API REQUEST ERROR - {resp.text}")
@@ -118,14 +203,45 @@ class Client:
         if kwargs:
             d = {snake_to_camel(k): v for (k, v) in kwargs.items()}
             url += f"?{urllib.parse.urlencode(d)}"
+        return self._get(url, name=singular(self.namespace), columnar=self.columnar)
+
+    def _get(
+        self, url: str, name: str, columnar: bool = False, ttl: float = 0.0
+    ) -> Response:
+        # Identical concurrent requests share one response.
+        accept = accept_header() if columnar else None
+        return self._single_flight.do(
+            (url, accept), lambda: self._request_get(url, name, accept), ttl=ttl
+        )
+
+    def _request_get(self, url: str, name: str, accept: Optional[str]) -> Response:
         logger.debug(f"GET {url}")
-        resp = self._session.get(url)
+        if accept is None:
+            resp = self._session.get(url, timeout=self.transport.timeout)
+        else:
+            resp = self._session.get(
+                url, headers={"Accept": accept}, timeout=self.transport.timeout
+            )
 
         if resp.status_code != 200:
             logger.error(f"API REQUEST ERROR - {resp.text}")
             resp.raise_for_status()
 
-        return Response(resp.json(), name=singular(self.namespace), client=self)
+        if accept is not None and is_arrow_response(resp):
+            try:
+                d = decode_arrow(resp.content)
+            except Exception as e:
+                logger.warning(f"Invalid Arrow response from {url}: {e}")
+                resp = self._session.get(
+                    url,
+                    headers={"Accept": "application/json"},
+                    timeout=self.transport.timeout,
+                )
+                resp.raise_for_status()
+            else:
+                return Response(d, name=name, client=self)
+
+        return Response(resp.json(), name=name, client=self)
 
     def delete(self, resource_id: str) -> Response:
         """
@@ -136,7 +252,7 @@ class Client:
         """
         url = f"{self._url}/{resource_id}".rstrip("/")
         logger.debug(f"DELETE {url}")
-        resp = self._session.delete(url)
+        resp = self._session.delete(url, timeout=self.transport.timeout)
         if resp.status_code != 200:
             logger.error(f"API REQUEST ERROR - {resp.text}")
             resp.raise_for_status()
@@ -150,11 +266,8 @@ class Client:
         :param object_id: The ID of the object.
         :return: A Response object representing the object.
         """
-        return Client(
-            api_key=self._api_key,
-            url=f"{self._base_url}/sessions/{session_id}/objects/{object_id}",
-            session=self._session,
-        ).get()
+        url = self._object_url.format(session_id=session_id, object_id=object_id)
+        return self._get(url, name=singular(object_id), ttl=self.status_ttl)
 
     def wait_for_object_status(
         self,
@@ -162,6 +275,7 @@ class Client:
         object_id: str,
         property_name: Optional[str] = None,
         timeout: Optional[int] = None,
+        polling_policy: Optional[PollingPolicy] = None,
     ) -> Response:
         """
         Wait for a specific object in a session to reach a final status
@@ -171,37 +285,36 @@ class Client:
         :param object_id: The ID of the object.
         :param property_name: The property to wait for. Defaults to None.
         :param timeout: The maximum time to wait in seconds. Defaults to None.
+        :param polling_policy: Polling schedule for this call.
+            Defaults to the client policy.
         :return: A Response object representing the object.
         """
-        timeout = timeout or self.wait_timeout
-        assert timeout is not None
+        policy = polling_policy or self.polling_policy
+        deadline = timeout or policy.deadline or self.wait_timeout
+        assert deadline is not None
         t0: float = time.monotonic()
-        status: Optional[str] = None
-        sleep_count = 1.0
+        attempt = 0
 
-        while status != "SUCCEEDED":
+        while True:
             resp = self.query_object(session_id, object_id)
 
-            status = resp.status
-
-            if status == "FAILED":
-                logger.debug(f"FAILED TASK {str(resp)}")
-                break
-
-            if property_name is not None:
-                if getattr(resp, property_name) is not None:
-                    status = "SUCCEEDED"
-                else:
-                    status = "RUNNING"
+            if is_resolved(resp, property_name):
+                if resp.d.get("status") == "FAILED":
+                    logger.debug(f"FAILED TASK {str(resp)}")
+                return resp
 
-            time.sleep(sleep_count)
-            t1 = time.monotonic()
-            sleep_count = min(max(1, timeout - (t1 - t0)), sleep_count * 2)
-
-            if (t1 - t0) > timeout:
+            elapsed = time.monotonic() - t0
+            if elapsed > deadline:
                 raise TimeoutError(f"Timeout waiting for object_id={object_id}")
 
-        return resp
+            time.sleep(min(policy.delay(attempt), max(0.0, deadline - elapsed)))
+            attempt += 1
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in _INHERITED_SETTINGS:
+            # Children are created again, with the new settings.
+            self.__dict__.get("_children", {}).clear()
 
     def __getattr__(self, item: str) -> "Client":
         """
@@ -210,10 +323,10 @@ class Client:
         :param item: The name of the attribute.
         :return: The attribute.
         """
+        if item.startswith("__") or "_url" not in self.__dict__:
+            raise AttributeError(item)
         item = item.replace("_", "-")
-        return Client(
-            self._api_key, f"{self._url}/{item}", self._session, self._base_url
-        )
+        return self._child(f"{self._url}/{item}")
 
     def with_path(self, resource_path: str) -> "Client":
         """
@@ -222,9 +335,45 @@ class Client:
         :param resource_path: The resource path to append to the base url.
         :return: The attribute.
         """
-        return Client(
-            self._api_key,
-            f"{self._base_url}/{resource_path.lstrip('/').rstrip('/')}",
-            self._session,
-            self._base_url,
-        )
+        return self._child(f"{self._base_url}/{resource_path.lstrip('/').rstrip('/')}")
+
+    def _child(self, url: str) -> "Client":
+        """
+        Client of a resource, sharing the session and settings of this client.
+        Children are cached per URL.
+        """
+        children = self.__dict__.setdefault("_children", {})
+        child = children.get(url)
+        if child is None:
+            child = Client.__new__(Client)
+            child.__dict__.update(self.__dict__)
+            child.__dict__["_url"] = url
+            child.__dict__["_children"] = {}
+            child = children.setdefault(url, child)
+        return child
+
+
+# Settings of a Client that are inherited by its children
+_INHERITED_SETTINGS = frozenset(
+    [
+        "wait_timeout",
+        "polling_policy",
+        "columnar",
+        "transport",
+        "status_ttl",
+        "compress_requests",
+    ]
+)
+
+
+def _rejects_gzip(resp: requests.Response) -> bool:
+    """
+    Check whether a response rejects a compressed request body, as opposed to
+    e.g. rejecting invalid inputs.
+    """
+    if resp.status_code == 415:
+        return True
+    if resp.status_code != 400:
+        return False
+    text = resp.text if isinstance(resp.text, str) else ""
+    return "content-encoding" in text.lower()
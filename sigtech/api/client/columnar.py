@@ -0,0 +1,66 @@
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import requests
+
+try:
+    import pyarrow  # type: ignore
+    import pyarrow.ipc  # type: ignore
+except ImportError:
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Schema metadata keys of Arrow responses: the name of the field holding the
+# table, and the remaining (non tabular) fields of the response as JSON.
+FIELD_METADATA_KEY = b"sigtech.field"
+JSON_METADATA_KEY = b"sigtech.json"
+
+
+def accept_header() -> Optional[str]:
+    """
+    Value of the ``Accept`` header requesting Arrow IPC with a JSON fallback.
+
+    :return: The header value, or None if pyarrow is not installed.
+    """
+    if pyarrow is None:
+        return None
+    return f"{ARROW_STREAM_MEDIA_TYPE}, application/json;q=0.9"
+
+
+def is_arrow_response(resp: requests.Response) -> bool:
+    """
+    Check whether a response holds an Arrow IPC stream.
+
+    :param resp: The HTTP response.
+    :return: True if the response content type is an Arrow stream.
+    """
+    content_type = resp.headers.get("Content-Type")
+    if not isinstance(content_type, str):
+        return False
+    return content_type.split(";")[0].strip() == ARROW_STREAM_MEDIA_TYPE
+
+
+def decode_arrow(content: bytes) -> Dict[str, Any]:
+    """
+    Decode an Arrow IPC stream to the equivalent of the JSON response.
+
+    The table is returned under the field named in the schema metadata
+    (``history`` by default) as a dict of NumPy arrays, one per column.
+
+    :param content: The Arrow IPC stream.
+    :return: Dictionary of response fields.
+    """
+    if pyarrow is None:
+        raise ImportError("pyarrow is required to decode Arrow responses")
+    table = pyarrow.ipc.open_stream(content).read_all()
+    metadata = table.schema.metadata or {}
+    d = json.loads(metadata.get(JSON_METADATA_KEY, b"{}"))
+    field = metadata.get(FIELD_METADATA_KEY, b"history").decode("utf-8")
+    d[field] = {
+        name: table.column(i).to_numpy() for i, name in enumerate(table.column_names)
+    }
+    return d
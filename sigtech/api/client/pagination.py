@@ -0,0 +1,139 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from sigtech.api.client.response import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 25_000
+
+
+def iter_pages(
+    client: Any, page_size: int = DEFAULT_PAGE_SIZE, **kwargs
+) -> Iterator[Response]:
+    """
+    Iterate over the pages of a paginated resource, fetching the next page in a
+    background thread while the current one is processed.
+
+    :param client: Client of the paginated resource.
+    :param page_size: Number of rows requested per page.
+    :param kwargs: The arguments for getting the resource.
+    :return: Iterator of the page responses, in order.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future: Optional["Future[Response]"] = executor.submit(
+            client.get, page_size=page_size, **kwargs
+        )
+        while future is not None:
+            page = future.result()
+            next_page_id = page.d.get("next_page_id")
+            if next_page_id is None:
+                future = None
+            else:
+                logger.debug(f"Fetching next page: {next_page_id}.")
+                future = executor.submit(
+                    client.get, page_size=page_size, page_id=next_page_id, **kwargs
+                )
+            yield page
+
+
+def column_array(values: Any) -> np.ndarray:
+    """
+    Convert a column of a page to an array.
+
+    :param values: List (JSON) or array (Arrow) of values.
+    :return: Array of the values.
+    """
+    if isinstance(values, list):
+        # Same dtype inference as building a DataFrame from lists.
+        arr = pd.Series(values).to_numpy()
+    else:
+        arr = np.asarray(values)
+    if arr.dtype == object and len(arr) > 0 and pd.isna(arr).all():
+        # e.g. a page of nulls in a numeric column
+        arr = np.full(len(arr), np.nan)
+    return arr
+
+
+class ColumnBuffer:
+    """
+    Growable NumPy array, appended to in chunks.
+    """
+
+    def __init__(self, capacity: int = 0):
+        """
+        Initialize a ColumnBuffer.
+
+        :param capacity: Number of rows to preallocate on the first append.
+        """
+        self._capacity = capacity
+        self._data: Optional[np.ndarray] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, values: Any) -> None:
+        """
+        Append values to the buffer.
+
+        :param values: List (JSON) or array (Arrow) of values.
+        """
+        chunk = column_array(values)
+        start = self._size
+        size = start + len(chunk)
+        if self._data is None:
+            self._data = np.empty(max(size, self._capacity), dtype=chunk.dtype)
+        else:
+            try:
+                dtype = np.result_type(self._data.dtype, chunk.dtype)
+            except TypeError:
+                dtype = np.dtype(object)
+            if dtype != self._data.dtype:
+                self._data = self._data.astype(dtype)
+            if size > len(self._data):
+                data = np.empty(max(size, 2 * len(self._data)), dtype=dtype)
+                data[:start] = self._data[:start]
+                self._data = data
+        self._data[start:size] = chunk
+        self._size = size
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        The values appended so far.
+
+        :return: Array of the values.
+        """
+        if self._data is None:
+            return np.empty(0)
+        return self._data[: self._size]
+
+
+def read_columns(
+    pages: Iterable[Dict[str, Any]], capacity: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    Concatenate the columns of the pages of a table.
+
+    :param pages: The pages, as dictionaries mapping column names to lists or
+        arrays of values.
+    :param capacity: Number of rows to preallocate per column.
+    :return: Dictionary mapping column names to arrays.
+    """
+    buffers: Dict[str, ColumnBuffer] = {}
+    for page in pages:
+        if not buffers:
+            buffers = {k: ColumnBuffer(capacity) for k in page}
+        elif page.keys() != buffers.keys():
+            raise ValueError(
+                f"Inconsistent page columns: {sorted(page)} != {sorted(buffers)}"
+            )
+        for k, values in page.items():
+            buffers[k].extend(values)
+    return {k: buffer.to_numpy() for (k, buffer) in buffers.items()}
@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from sigtech.api.client.polling import PollingPolicy, is_resolved
+from sigtech.api.client.response import Response, raise_if_failed
+
+if TYPE_CHECKING:
+    # Used at import time only, because of circular dependency
+    from sigtech.api.client.client import Client
+
+logger = logging.getLogger(__name__)
+
+_Key = Tuple[str, str, Optional[str]]
+
+
+class _PendingObject:
+    def __init__(self, deadline: float):
+        self.future: "Future[Response]" = Future()
+        self.deadline = deadline
+        self.attempt = 0
+        self.next_poll = time.monotonic()
+
+
+class StatusPoller:
+    """
+    Central scheduler polling the status of many pending API objects on a single
+    timer thread, with a bounded number of concurrent requests.
+
+    Every waiter receives a ``Future`` which resolves once its object reaches a
+    final status (or contains the awaited property). Waiters for the same object
+    share one future and one polling schedule.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        max_workers: int = 16,
+        polling_policy: Optional[PollingPolicy] = None,
+    ):
+        """
+        Initialize a StatusPoller.
+
+        :param client: Client used to query object statuses.
+        :param max_workers: Maximum number of concurrent status requests.
+        :param polling_policy: Polling schedule per object.
+            Defaults to the client policy.
+        """
+        self._client = client
+        self._policy = polling_policy or client.polling_policy
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sigtech-poller"
+        )
+        self._pending: Dict[_Key, _PendingObject] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(
+        self,
+        session_id: str,
+        object_id: str,
+        property_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> "Future[Response]":
+        """
+        Register an object to be polled until it reaches a final status.
+
+        :param session_id: The ID of the session.
+        :param object_id: The ID of the object.
+        :param property_name: The property to wait for. Defaults to None.
+        :param timeout: The maximum time to wait in seconds.
+            Defaults to the polling policy deadline or client settings.
+        :return: A future resolving to the latest object response.
+        """
+        key = (session_id, object_id, property_name)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("StatusPoller has been shut down.")
+            if key not in self._pending:
+                timeout = timeout or self._policy.deadline or self._client.wait_timeout
+                assert timeout is not None
+                self._pending[key] = _PendingObject(time.monotonic() + timeout)
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="sigtech-poller-timer", daemon=True
+                    )
+                    self._thread.start()
+                self._cond.notify()
+            return self._pending[key].future
+
+    def wait_all(
+        self,
+        responses: Sequence[Response],
+        property_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Response]:
+        """
+        Wait for all creation responses together.
+
+        :param responses: Creation responses of the objects to wait for.
+        :param property_name: The property to wait for. Defaults to None.
+        :param timeout: The maximum time to wait for each object in seconds.
+        :return: The final object responses, in input order.
+        """
+        keys = []
+        for response in responses:
+            if not response.kwargs or "session_id" not in response.kwargs:
+                raise ValueError("Both 'session_id' and 'object_id' must be present.")
+            keys.append((response.kwargs["session_id"], response.object_id))
+
+        futures: List["Future[Response]"] = []
+        for response, (session_id, object_id) in zip(responses, keys):
+            if is_resolved(response, property_name):
+                f: "Future[Response]" = Future()
+                f.set_result(response)
+            else:
+                f = self.submit(
+                    session_id, object_id, property_name=property_name, timeout=timeout
+                )
+            futures.append(f)
+
+        results = []
+        for f, (session_id, object_id) in zip(futures, keys):
+            result = f.result()
+            raise_if_failed(result, session_id, object_id)
+            results.append(result)
+        return results
+
+    def shutdown(self) -> None:
+        """
+        Stop the timer thread and cancel all outstanding waits.
+        """
+        with self._cond:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            self._cond.notify()
+        for p in pending.values():
+            p.future.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    now = time.monotonic()
+                    due = [
+                        (k, p) for (k, p) in self._pending.items() if p.next_poll <= now
+                    ]
+                    if due:
+                        break
+                    next_poll = min(
+                        (p.next_poll for p in self._pending.values()), default=None
+                    )
+                    self._cond.wait(None if next_poll is None else next_poll - now)
+
+            try:
+                results = list(self._executor.map(self._poll, [k for (k, _) in due]))
+            except RuntimeError:
+                # Executor was shut down while polling
+                return
+
+            with self._cond:
+                if self._closed:
+                    return
+                now = time.monotonic()
+                for (key, p), (resp, exc) in zip(due, results):
+                    if exc is None and resp is not None:
+                        if not is_resolved(resp, key[2]):
+                            if now <= p.deadline:
+                                p.next_poll = now + min(
+                                    self._policy.delay(p.attempt), p.deadline - now
+                                )
+                                p.attempt += 1
+                                continue
+                            exc = TimeoutError(
+                                f"Timeout waiting for object_id={key[1]}"
+                            )
+                    self._pending.pop(key, None)
+                    if exc is not None:
+                        p.future.set_exception(exc)
+                    else:
+                        p.future.set_result(resp)
+
+    def _poll(self, key: _Key):
+        try:
+            return self._client.query_object(key[0], key[1]), None
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"Error polling object_id={key[1]}: {e}")
+            return None, e
@@ -0,0 +1,71 @@
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    # Used at import time only, because of circular dependency
+    from sigtech.api.client.response import Response
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """
+    Polling schedule used while waiting for an API object.
+
+    :param initial_delay: Delay before the second poll in seconds.
+    :param max_delay: Upper bound on the delay between two polls in seconds.
+    :param backoff_factor: Multiplier applied to the delay after every poll.
+    :param jitter: Relative random jitter applied to every delay, e.g. ``0.1``
+        for +/-10%.
+    :param deadline: Maximum total wait in seconds. Defaults to the client
+        ``wait_timeout`` if None.
+    """
+
+    initial_delay: float = 0.25
+    max_delay: float = 30.0
+    backoff_factor: float = 2.0
+    jitter: float = 0.1
+    deadline: Optional[float] = None
+
+    def __post_init__(self):
+        if self.initial_delay < 0:
+            raise ValueError("initial_delay must be non-negative")
+        if self.max_delay < self.initial_delay:
+            raise ValueError("max_delay must be greater or equal to initial_delay")
+        if self.backoff_factor < 1:
+            raise ValueError("backoff_factor must be at least 1")
+        if not 0 <= self.jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("deadline must be positive")
+
+    def delay(self, attempt: int) -> float:
+        """
+        Delay to sleep after the given (zero based) unsuccessful poll.
+
+        :param attempt: Number of polls already made minus one.
+        :return: The delay in seconds.
+        """
+        d = min(self.max_delay, self.initial_delay * self.backoff_factor**attempt)
+        if self.jitter:
+            d *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, d)
+
+
+DEFAULT_POLLING_POLICY = PollingPolicy()
+
+
+def is_resolved(resp: "Response", property_name: Optional[str] = None) -> bool:
+    """
+    Check whether an object response is in a terminal state, or contains the
+    awaited property.
+
+    :param resp: The latest object response.
+    :param property_name: The property to wait for. Defaults to None.
+    :return: True if no further polling is required.
+    """
+    if resp.d.get("status") == "FAILED":
+        return True
+    if property_name is not None:
+        return resp.d.get(property_name) is not None
+    return resp.d.get("status") == "SUCCEEDED"
@@ -1,6 +1,7 @@
 import json
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from sigtech.api.client.polling import PollingPolicy
 from sigtech.api.client.utils import SigApiException, camel_to_snake
 
 if TYPE_CHECKING:
@@ -52,7 +53,10 @@ class Response:
         return self.client.query_object(self.kwargs["session_id"], self.object_id)
 
     def wait_for_object_status(
-        self, property_name: Optional[str] = None, timeout: Optional[int] = None
+        self,
+        property_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        polling_policy: Optional[PollingPolicy] = None,
     ):
         """
         Wait for the object status to be in a final state or a property to be available.
@@ -61,6 +65,8 @@ class Response:
             (optional; waits for final state if `None`).
         :param timeout: The maximum amount of time to wait.
             (optional; defaults to client settings).
+        :param polling_policy: The polling schedule to use.
+            (optional; defaults to client settings).
         :return: The response data for the final object status.
         """
         assert self.kwargs and self.d
@@ -78,19 +84,33 @@ class Response:
 
         assert self.client is not None
         response = self.client.wait_for_object_status(
-            session_id, object_id, property_name=property_name, timeout=timeout
+            session_id,
+            object_id,
+            property_name=property_name,
+            timeout=timeout,
+            polling_policy=polling_policy,
         )
 
-        if response.status == "FAILED":
-            error_message = response.d.get("error", "")
-            raise SigApiException(
-                f"SigTech API Error - session_id : {session_id} - object_id :"
-                f" {object_id} - Message : {error_message}"
-            )
-
+        raise_if_failed(response, session_id, object_id)
         return response
 
     def __getattr__(self, name):
         raise AttributeError(
             f"'{repr(self)}' Response object has no attribute '{name}'"
         )
+
+
+def raise_if_failed(response: Response, session_id: str, object_id: str) -> None:
+    """
+    Raise a ``SigApiException`` if an object response is in the FAILED state.
+
+    :param response: The latest object response.
+    :param session_id: The ID of the session.
+    :param object_id: The ID of the object.
+    """
+    if response.status == "FAILED":
+        error_message = response.d.get("error", "")
+        raise SigApiException(
+            f"SigTech API Error - session_id : {session_id} - object_id :"
+            f" {object_id} - Message : {error_message}"
+        )
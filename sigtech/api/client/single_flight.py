@@ -0,0 +1,77 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call for a key is in flight,
+    other callers with the same key wait for it and share its result (or its
+    exception), instead of making their own call.
+
+    Results can also be kept for a short time to live, so that calls shortly
+    after a completed call share its result as well.
+    """
+
+    max_cached = 1024
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T], ttl: float = 0.0) -> T:
+        """
+        Call a function, unless an identical call is in flight or cached.
+
+        :param key: Key identifying identical calls.
+        :param fn: The function to call.
+        :param ttl: Time in seconds a result is shared with later calls which
+            also pass a positive ``ttl``. Not cached if 0.
+        :return: The result of the call.
+        """
+        with self._lock:
+            if ttl > 0:
+                entry = self._cache.get(key)
+                if entry is not None and time.monotonic() - entry[0] < ttl:
+                    return entry[1]
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            if ttl > 0:
+                self._store(key, result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def clear(self) -> None:
+        """
+        Remove all cached results.
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._cache) >= self.max_cached:
+                # Entries are in insertion order, drop the older half.
+                for k in list(self._cache)[: self.max_cached // 2]:
+                    del self._cache[k]
+            self._cache.pop(key, None)
+            self._cache[key] = (now, result)
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@dataclass(frozen=True)
+class TransportSettings:
+    """
+    HTTP transport settings of a Client.
+
+    :param pool_connections: Number of connection pools (hosts) to cache.
+    :param pool_maxsize: Maximum number of connections kept alive per pool.
+        Should be at least the number of threads sharing the client.
+    :param connect_timeout: Timeout for establishing a connection in seconds.
+        No timeout if None.
+    :param read_timeout: Timeout for waiting for data from the server in seconds.
+        No timeout if None.
+    :param max_retries: Number of retries of idempotent requests failing with a
+        connection error or a status in ``retry_statuses``.
+    :param backoff_factor: Retries sleep ``backoff_factor * 2 ** (retry - 1)``
+        seconds, unless the server sends a ``Retry-After`` header.
+    :param backoff_jitter: Random jitter added to every retry sleep in seconds.
+    :param retry_statuses: HTTP statuses that are retried.
+    :param retry_methods: HTTP methods that are retried. POST requests create
+        objects and are not retried by default.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = 120.0
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_jitter: float = 0.25
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    retry_methods: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    def __post_init__(self):
+        if self.pool_connections < 1 or self.pool_maxsize < 1:
+            raise ValueError("pool sizes must be positive")
+        for timeout in (self.connect_timeout, self.read_timeout):
+            if timeout is not None and timeout <= 0:
+                raise ValueError("timeouts must be positive")
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        if self.backoff_factor < 0 or self.backoff_jitter < 0:
+            raise ValueError("backoff_factor and backoff_jitter must be non-negative")
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        The ``timeout`` argument of requests.
+
+        :return: Tuple of the connect and read timeouts.
+        """
+        return (self.connect_timeout, self.read_timeout)
+
+    def retry(self) -> Retry:
+        """
+        The urllib3 retry policy.
+
+        :return: The Retry object.
+        """
+        kwargs: Dict[str, Any] = dict(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=frozenset(self.retry_methods),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        try:
+            return Retry(backoff_jitter=self.backoff_jitter, **kwargs)
+        except TypeError:
+            # urllib3<2 has no backoff jitter
+            return Retry(**kwargs)
+
+    def mount(self, session: requests.Session) -> None:
+        """
+        Mount HTTP adapters with these settings on a session.
+
+        :param session: The session.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.retry(),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+
+DEFAULT_TRANSPORT_SETTINGS = TransportSettings()
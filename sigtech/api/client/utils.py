@@ -1,6 +1,7 @@
 import datetime as dtm
 import math
 import re
+from typing import Dict, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -76,3 +77,82 @@ def series_to_dict(s: pd.Series) -> dict:
         "$timestamp": timestamps.tolist(),
         "$history": [o if math.isfinite(o) else None for o in s.values.tolist()],
     }
+
+
+def parse_timestamps(timestamps: Union[Sequence, np.ndarray]) -> pd.DatetimeIndex:
+    """
+    Converts ISO-8601 timestamp strings to a datetime index.
+
+    :param timestamps: The timestamps, e.g. ``["2020-01-01T00:00:00", ...]``, or
+        a datetime64 array.
+    :return: The parsed timestamps.
+    """
+    if len(timestamps) > 0 and _has_utc_offset(timestamps[0]):
+        return pd.DatetimeIndex(pd.to_datetime(list(timestamps)))
+    try:
+        # Vectorized fixed format parse, much faster than ``pd.to_datetime``.
+        values = np.asarray(timestamps, dtype="datetime64[ns]")
+    except (TypeError, ValueError):
+        return pd.DatetimeIndex(pd.to_datetime(list(timestamps)))
+    return pd.DatetimeIndex(values)
+
+
+def _has_utc_offset(timestamp) -> bool:
+    # numpy drops UTC offsets, so these timestamps are parsed by pandas instead.
+    if not isinstance(timestamp, str):
+        return False
+    time_part = timestamp[19:]
+    return timestamp.endswith("Z") or "+" in time_part or "-" in time_part
+
+
+def dict_to_frame(
+    history: dict,
+    columns: Optional[Dict[str, str]] = None,
+    index_name: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Converts a history payload of the API to a DataFrame sorted by date.
+
+    :param history: The payload, with timestamps in ``$timestamp`` and one list of
+        values per column.
+    :param columns: Optional mapping to rename columns.
+    :param index_name: Name of the datetime index.
+    :return: DataFrame with a datetime index and one column per payload field.
+    """
+    columns = columns or {}
+    index = parse_timestamps(history.get("$timestamp", []))
+    index.name = index_name
+    data = {}
+    for key, values in history.items():
+        if key == "$timestamp":
+            continue
+        try:
+            arr = np.asarray(values, dtype="float64")
+        except (TypeError, ValueError):
+            arr = np.asarray(values, dtype=object)
+        data[columns.get(key, key)] = arr
+    df = pd.DataFrame(data, index=index, copy=False)
+    if not index.is_monotonic_increasing:
+        df = df.sort_index(kind="stable")
+    return df
+
+
+def dict_to_series(
+    history: dict, name: Optional[str] = None, index_name: Optional[str] = None
+) -> pd.Series:
+    """
+    Converts a history payload of the API to a float series sorted by date,
+    inverse of ``series_to_dict``.
+
+    :param history: The payload, with ``$timestamp`` and ``$history`` lists.
+    :param name: Name of the series.
+    :param index_name: Name of the datetime index.
+    :return: The series.
+    """
+    index = parse_timestamps(history.get("$timestamp", []))
+    index.name = index_name
+    values = np.asarray(history.get("$history", []), dtype="float64")
+    ts = pd.Series(values, index=index, name=name, copy=False)
+    if not index.is_monotonic_increasing:
+        ts = ts.sort_index(kind="stable")
+    return ts
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(*parts: Any) -> str:
+    """
+    Stable hash of JSON serializable inputs, used as a cache key.
+
+    :param parts: The inputs to hash.
+    :return: Hex digest of the inputs.
+    """
+    s = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    Persistent cache of JSON values in a local directory, with optional expiry
+    and a total size limit.
+
+    Every entry is one file, written to a temporary file and atomically renamed
+    into place, so concurrent readers (threads or processes) never see partially
+    written entries.
+    """
+
+    suffix = ".json"
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize a DiskCache.
+
+        :param directory: Directory to store entries in. Created if missing.
+        :param ttl: Time to live of entries in seconds. Entries never expire if None.
+        :param max_bytes: Total size limit in bytes. The oldest entries are evicted
+            when the limit is exceeded. Unbounded if None.
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key: str) -> Any:
+        """
+        Retrieve a value from the cache.
+
+        :param key: The cache key.
+        :return: The cached value, or None if missing or expired.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+        if self.ttl is not None and time.time() - entry["created"] > self.ttl:
+            self.delete(key)
+            return None
+        return entry["value"]
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        :param key: The cache key.
+        :param value: JSON serializable value.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"created": time.time(), "value": value}, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from the cache, if present.
+
+        :param key: The cache key.
+        """
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """
+        Remove all values from the cache.
+        """
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.suffix):
+                self.delete(entry.name[: -len(self.suffix)])
+
+    def _evict(self) -> None:
+        if self.max_bytes is None:
+            return
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.suffix):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.name))
+        total = sum(size for (_, size, _) in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.delete(name[: -len(self.suffix)])
+            total -= size
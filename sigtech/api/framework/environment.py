@@ -1,9 +1,32 @@
+import concurrent.futures
+import contextvars
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Union, cast
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from sigtech.api.client.client import Client
+from sigtech.api.client.poller import StatusPoller
+from sigtech.api.client.single_flight import SingleFlight
 from sigtech.api.client.utils import SigApiException
 from sigtech.api.framework import config
+from sigtech.api.framework.disk_cache import DiskCache
+from sigtech.api.framework.history_store import HistoryStore
+from sigtech.api.framework.payload_cache import PayloadCache
 
 if TYPE_CHECKING:
     # Used at import time only, because of circular dependency
@@ -29,13 +52,37 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 _GLOBAL_ENVIRONMENT: Optional["Environment"] = None
+_GLOBAL_ENVIRONMENT_LOCK = threading.Lock()
+
+# Environments entered with ``with``, local to the current thread or asyncio task
+_ENVIRONMENT_STACK: contextvars.ContextVar[Tuple["Environment", ...]] = (
+    contextvars.ContextVar("sigtech_environment_stack", default=())
+)
+
+T = TypeVar("T")
 
 
 class Environment:
     """
-    Class to hold the environments data
+    Class to hold the environments data.
+
+    An environment can be used as a context manager to make it the current
+    environment for the enclosed code only. This is local to the current thread
+    or asyncio task, so several environments with different settings can be used
+    concurrently in one process:
+
+    ::
+
+        with Environment(Client()) as e:
+            e[config.IGNORE_T_COSTS] = True
+            strategy = sig.RollingFutureStrategy(...)
     """
 
+    # Maximum number of objects constructed concurrently by ``executor``
+    max_workers = 16
+    # Maximum number of resolved instruments held by ``hold``
+    max_held_objects = 4096
+
     def __init__(self, client: Client) -> None:
         """
         Initialize an environment with given client and session id.
@@ -43,24 +90,124 @@ class Environment:
         :param client: Client object
         :param session_id: String representing session id
         """
-        self._session_id = None
+        self._session_id: Optional[str] = None
         self.client = client
-        self.object_register: Dict[str, "FrameworkApiObject"] = {}
-        self.all_objects: Set["FrameworkApiObject"] = set()
+        # Objects are referenced weakly, so unused objects and their downloaded
+        # data can be garbage collected in long-lived sessions.
+        self.object_register: "weakref.WeakValueDictionary[str, FrameworkApiObject]" = (
+            weakref.WeakValueDictionary()
+        )
+        self.objects_by_id: "weakref.WeakValueDictionary[str, FrameworkApiObject]" = (
+            weakref.WeakValueDictionary()
+        )
+        self.all_objects: "weakref.WeakSet[FrameworkApiObject]" = weakref.WeakSet()
+        # Recently resolved instruments are held strongly, so that repeated
+        # lookups do not create them again. Their downloaded data is still
+        # bounded by the payload cache.
+        self._held: "OrderedDict[str, FrameworkApiObject]" = OrderedDict()
+        self.payload_cache = PayloadCache()
+        # Optional persistent cache of reference data, e.g.
+        # ``env().reference_data_cache = DiskCache("~/.sigtech/reference_data")``
+        self.reference_data_cache: Optional[DiskCache] = None
+        # Optional persistent store of history series, e.g.
+        # ``env().history_store = HistoryStore("~/.sigtech/history")``
+        self.history_store: Optional[HistoryStore] = None
+        # Object IDs of strategies by content hash, so identical strategies are
+        # not built again while in use. Creation responses can also be
+        # persisted for sessions resumed with ``resume_session``, e.g.
+        # ``env().strategy_cache = DiskCache("~/.sigtech/strategies")``.
+        self.memoize_strategies = True
+        self.strategy_memo: Dict[str, Optional[str]] = {}
+        self.strategy_cache: Optional[DiskCache] = None
+        self._strategy_flight = SingleFlight()
         self.config: Dict[str, Any] = {}
+        self._poller: Optional[StatusPoller] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> "Environment":
+        _ENVIRONMENT_STACK.set(_ENVIRONMENT_STACK.get() + (self,))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        stack = _ENVIRONMENT_STACK.get()
+        assert stack and stack[-1] is self, "Environments must exit in LIFO order."
+        _ENVIRONMENT_STACK.set(stack[:-1])
 
     def __getitem__(self, key: str) -> "FrameworkApiObject":
         return self.config[key]
 
     def __setitem__(self, key: str, value: Any):
-        if self._session_id is not None:
-            raise SigApiException("Cannot change environment config after using it.")
-        self.config[key] = value
+        with self._lock:
+            if self._session_id is not None:
+                raise SigApiException(
+                    "Cannot change environment config after using it."
+                )
+            self.config[key] = value
+
+    def register(self, fa_obj: "FrameworkApiObject") -> None:
+        """
+        Add an object to the environment, indexed by object id and, if already
+        known, by name.
+
+        :param fa_obj: The object to register.
+        """
+        self.all_objects.add(fa_obj)
+        self.objects_by_id[fa_obj.api_object_id] = fa_obj
+        name = fa_obj.creation_response.d.get("name")
+        if name is not None:
+            self.register_name(name, fa_obj)
+
+    def hold(self, fa_obj: "FrameworkApiObject") -> None:
+        """
+        Keep a strong reference to a resolved instrument. Only the
+        ``max_held_objects`` most recently resolved instruments are held.
+
+        :param fa_obj: The object to hold.
+        """
+        with self._lock:
+            self._held[fa_obj.api_object_id] = fa_obj
+            self._held.move_to_end(fa_obj.api_object_id)
+            while len(self._held) > self.max_held_objects:
+                self._held.popitem(last=False)
+
+    def register_name(self, name: str, fa_obj: "FrameworkApiObject") -> None:
+        """
+        Index an object by its resolved name.
+
+        :param name: The name of the object.
+        :param fa_obj: The object to register.
+        """
+        self.object_register[name] = fa_obj
 
     @property
-    def session_id(self):
-        if self._session_id is not None:
-            return self._session_id
+    def poller(self) -> StatusPoller:
+        """
+        Shared status poller used to wait for many objects at once.
+        """
+        with self._lock:
+            if self._poller is None:
+                self._poller = StatusPoller(self.client)
+            return self._poller
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Shared executor constructing objects submitted with ``Strategy.submit``.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="sigtech-submit"
+                )
+            return self._executor
+
+    def session_settings(self) -> Dict[str, Any]:
+        """
+        API session settings derived from the environment config.
+
+        :return: Dictionary of session settings.
+        """
         empty = object()
         settings = {}
 
@@ -80,18 +227,45 @@ class Environment:
         if v is not empty:
             settings["totalReturn"] = _invert(v)
 
-        session = self.client.sessions.create(settings=settings)
-        self._session_id = session.session_id
+        return settings
+
+    def resume_session(self, session_id: str) -> None:
+        """
+        Use an existing API session instead of creating a new one.
+
+        :param session_id: ID of the session, e.g. ``env().session_id`` of an
+            earlier run.
+        """
+        with self._lock:
+            if self._session_id is not None and self._session_id != session_id:
+                raise SigApiException("The environment already has a session.")
+            self._session_id = session_id
+
+    @property
+    def session_id(self):
+        if self._session_id is not None:
+            return self._session_id
+        with self._lock:
+            # Another thread may have created the session while we waited
+            if self._session_id is not None:
+                return self._session_id
+            session = self.client.sessions.create(settings=self.session_settings())
+            self._session_id = session.session_id
         logger.info(f"Session {session.session_id} created")
         return self._session_id
 
 
 def env() -> Environment:
     """
-    Retrieve the current global environment.
+    Retrieve the current environment: the innermost environment entered with
+    ``with`` in this thread or task, else the global environment.
 
-    :return: Returns the global Environment object.
+    :return: Returns the current Environment object.
     """
+    stack = _ENVIRONMENT_STACK.get()
+    if stack:
+        return stack[-1]
+
     if _GLOBAL_ENVIRONMENT is None:
         raise SigApiException(
             "Please initialize the environment by running the `init` method from"
@@ -112,11 +286,29 @@ def init(api_client: Optional[Client] = None) -> Environment:
     """
 
     global _GLOBAL_ENVIRONMENT
-    _GLOBAL_ENVIRONMENT = _GLOBAL_ENVIRONMENT or _initialise_environment(api_client)
+    with _GLOBAL_ENVIRONMENT_LOCK:
+        _GLOBAL_ENVIRONMENT = _GLOBAL_ENVIRONMENT or _initialise_environment(api_client)
     logger.info("Environment Initialized")
     return _GLOBAL_ENVIRONMENT
 
 
+def submit_in_context(
+    executor: concurrent.futures.Executor,
+    fn: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> "concurrent.futures.Future[T]":
+    """
+    Submit a call to an executor, running it with a copy of the current context,
+    so worker threads see the same current environment as the caller.
+
+    :param executor: The executor to submit to.
+    :param fn: The callable.
+    :return: A future for the result of the call.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
 def _initialise_environment(api_client) -> Environment:
     client = api_client or Client()
 
@@ -141,45 +333,92 @@ class obj:
         :param name: The name of the object.
         :return: The object if it exists, else None.
         """
+        # Retrieve the current environment
+        current_env = env()
+        existing = obj._find(current_env, name)
+        if existing is not None:
+            return existing
 
-        # pylint: disable=import-outside-toplevel
-        from sigtech.api.framework.fixtures import FIXTURES
-        from sigtech.api.framework.instruments.cash import Cash
-        from sigtech.api.framework.instruments.fixes import FXFix
-        from sigtech.api.framework.instruments.futures import Future
-        from sigtech.api.framework.instruments.indices import Index
-        from sigtech.api.framework.instruments.option_groups import (
-            EquityIndexOTCOptionsGroup,
-            FXOTCOptionsGroup,
-        )
+        new_instrument = obj._create(current_env, name)
+        new_instrument.creation_response.wait_for_object_status()
 
-        InstrumentType = Union[
-            Cash,
-            FXFix,
-            Future,
-            Index,
-            EquityIndexOTCOptionsGroup,
-            FXOTCOptionsGroup,
-        ]
+        return cast("InstrumentType", new_instrument)
 
-        # Retrieve the current environment
+    @staticmethod
+    def get_many(names: Iterable[str], max_workers: int = 16) -> List["InstrumentType"]:
+        """
+        Retrieve many objects using their framework names from the environment.
+
+        Names are de-duplicated, and objects which are not already known are
+        created concurrently, then waited on together.
+
+        :param names: The names of the objects.
+        :param max_workers: Maximum number of concurrent creation requests.
+        :return: The objects, in the same order as ``names``.
+        """
+        names = list(names)
         current_env = env()
-        if name in current_env.object_register:
-            return cast(InstrumentType, current_env.object_register[name])
 
-        for fa_obj in current_env.all_objects:
-            if name == fa_obj.name:
-                return cast(InstrumentType, fa_obj)
+        resolved: Dict[str, "InstrumentType"] = {}
+        missing: List[str] = []
+        for name in dict.fromkeys(names):
+            existing = obj._find(current_env, name)
+            if existing is not None:
+                resolved[name] = existing
+            else:
+                missing.append(name)
+
+        if missing:
+            # Create the session up front, not from the worker threads
+            _ = current_env.session_id
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="sigtech-get-many"
+            ) as executor:
+                futures = [
+                    submit_in_context(executor, obj._create, current_env, n)
+                    for n in missing
+                ]
+                created = [f.result() for f in futures]
+            results = current_env.poller.wait_all(
+                [o.creation_response for o in created]
+            )
+            for o, result in zip(created, results):
+                o._status = result.d.get("status")
+            resolved.update(zip(missing, cast(List["InstrumentType"], created)))
+
+        return [resolved[name] for name in names]
 
-            if name == fa_obj.api_object_id:
-                return cast(InstrumentType, fa_obj)
+    @staticmethod
+    def _find(current_env: Environment, name: str) -> Optional["InstrumentType"]:
+        """
+        Look up an existing object by name or object id, or a fixture.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sigtech.api.framework.fixtures import FIXTURES
+
+        fa_obj = current_env.object_register.get(name)
+        if fa_obj is None:
+            fa_obj = current_env.objects_by_id.get(name)
+        if fa_obj is not None:
+            current_env.hold(fa_obj)
+            return cast("InstrumentType", fa_obj)
 
         try:
-            return cast(InstrumentType, FIXTURES[name])
+            return cast("InstrumentType", FIXTURES[name])
         except KeyError:
-            pass
+            return None
+
+    @staticmethod
+    def _create(current_env: Environment, name: str) -> "FrameworkApiObject":
+        """
+        Create a new instrument object, without waiting for it to complete.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sigtech.api.framework.instruments.cash import Cash
+        from sigtech.api.framework.instruments.fixes import FXFix
+        from sigtech.api.framework.instruments.futures import Future
+        from sigtech.api.framework.instruments.indices import Index
 
-        current_env = env()
         instrument_response = current_env.client.instruments.create(
             session_id=current_env.session_id,
             identifier=name,
@@ -196,10 +435,9 @@ class obj:
         except KeyError:
             raise NotImplementedError(f"Unmapped class for type: {instrument_type}")
 
-        new_instrument = instrument_cls(instrument_response)
-        new_instrument.creation_response.wait_for_object_status()
-
-        return cast(InstrumentType, new_instrument)
+        instrument = instrument_cls(instrument_response)
+        current_env.hold(instrument)
+        return instrument
 
 
 def _invert(b: Optional[bool]):
@@ -1,29 +1,55 @@
 import logging
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, TypeVar, Union
+
+import numpy as np
+import pandas as pd
 
 from sigtech.api.client.response import Response
-from sigtech.api.client.utils import SigApiException
-from sigtech.api.framework.environment import env
+from sigtech.api.client.utils import SigApiException, dict_to_series
+from sigtech.api.framework.disk_cache import content_hash
+from sigtech.api.framework.environment import Environment, env, submit_in_context
+from sigtech.api.framework.payload_cache import CachedPayload
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", bound="FrameworkApiObject")
+
 
 class FrameworkApiObject:
     """
     A class used to handle API objects within the framework.
     """
 
+    # Downloaded data is held in the environment's payload cache, so it can be
+    # evicted under memory pressure and fetched again on demand.
+    _reference_data = CachedPayload()
+    _history = CachedPayload()
+    _metrics = CachedPayload()
+    _data_df = CachedPayload()
+
     def __init__(self, creation_response: Response) -> None:
         """
         Initialize a FrameworkApiObject with a given creation_response.
 
         :param creation_response: The creation_response to associate with the object.
         """
+        self._environment = env()
+        self._payload_cache = self._environment.payload_cache
         self.creation_response: Response = creation_response
         self._status: Optional[str] = None
         self._name: Optional[str] = None
-        self._reference_data: Optional[dict] = None
-        env().all_objects.add(self)
+        self._reference_data = None
+        self._environment.register(self)
+
+    @property
+    def environment(self) -> Environment:
+        """
+        Retrieve the environment the API object was created in.
+
+        :return: The environment of the API object.
+        """
+        return self._environment
 
     @property
     def api_status(self) -> str:
@@ -73,28 +99,232 @@ class FrameworkApiObject:
                 property_name="name"
             )
             self._name = latest_response.name
-            env().object_register[self._name] = self
+            self._environment.register_name(self._name, self)
 
         except Exception as e:
             raise SigApiException(f"Error while getting the name: {str(e)}")
 
         return self._name
 
+    def _content_hash(self) -> Optional[str]:
+        """
+        Hash of the creation endpoint, creation inputs and session settings of the
+        API object, identifying its content across sessions.
+
+        :return: The hash, or None if the creation inputs are unknown.
+        """
+        response = self.creation_response
+        if response.kwargs is None or response.client is None:
+            return None
+        inputs = {k: v for k, v in response.kwargs.items() if k != "session_id"}
+        return content_hash(
+            response.client.url, inputs, self._environment.session_settings()
+        )
+
     def _get_reference_data(self):
         """
-        Fetch reference data from API.
+        Fetch reference data from API, or from the environment's reference data
+        cache if one is configured.
         """
         if self._reference_data is not None:
             return self._reference_data
+        if self._load_cached_reference_data():
+            return self._reference_data
         self.creation_response.wait_for_object_status()
-        reference_data = (
-            env()
-            .client.data.reference.get(
-                session_id=env().session_id,
-                object_id=self.api_object_id,
-            )
-            .reference
-        )
+        return self._fetch_reference_data()
+
+    def _load_cached_reference_data(self) -> bool:
+        """
+        Load reference data from the environment's reference data cache.
+
+        :return: True if the reference data was found in the cache.
+        """
+        cache = self._environment.reference_data_cache
+        key = self._content_hash() if cache is not None else None
+        if cache is None or key is None:
+            return False
+        reference_data = cache.get(key)
+        if reference_data is None:
+            return False
+        self._reference_data = reference_data
+        return True
+
+    def _fetch_reference_data(self) -> dict:
+        """
+        Download reference data of a completed object from API.
+        """
+        reference_data = self._environment.client.data.reference.get(
+            session_id=self._environment.session_id,
+            object_id=self.api_object_id,
+        ).reference
         assert isinstance(reference_data, dict)
+        cache = self._environment.reference_data_cache
+        key = self._content_hash() if cache is not None else None
+        if cache is not None and key is not None:
+            cache.put(key, reference_data)
         self._reference_data = reference_data
-        return self._reference_data
+        return reference_data
+
+    def _get_history(
+        self,
+        index_name: Optional[str] = "date",
+        refresh: bool = False,
+        overlap: int = 5,
+    ) -> pd.Series:
+        """
+        Fetch the valuation history of a completed object from API, or from the
+        environment's history store if one is configured.
+
+        :param index_name: Name of the datetime index of the series.
+        :param refresh: If True, bring a cached history up to date by downloading
+            only the points after the last cached timestamp.
+        :param overlap: Number of trailing cached points downloaded again on
+            refresh, to check that they did not change.
+        :return: The history series.
+        """
+        if self._history is not None and not refresh:
+            return self._history
+
+        store = self._environment.history_store
+        key = self._content_hash() if store is not None else None
+        cached = self._history
+        if cached is None and store is not None and key is not None:
+            cached = store.get(key)
+            if cached is not None:
+                if self._name is None and cached.name is not None:
+                    self._name = str(cached.name)
+                    self._environment.register_name(self._name, self)
+                cached.index.name = index_name
+
+        if cached is not None and not refresh:
+            ts = cached
+        elif cached is not None and len(cached) > 0:
+            ts = self._refresh_history(cached, index_name, overlap)
+        else:
+            ts = self._download_history(index_name)
+
+        if store is not None and key is not None and ts is not cached:
+            store.put(key, ts)
+        self._history = ts
+        return ts
+
+    def _refresh_history(
+        self, cached: pd.Series, index_name: Optional[str], overlap: int
+    ) -> pd.Series:
+        """
+        Append the points after the cached tail to a cached history, after
+        checking the last ``overlap`` cached points against the API.
+        """
+        start = cached.index[-min(max(overlap, 1), len(cached))]
+        fresh = self._download_history(index_name, start_date=start.isoformat())
+        if len(fresh) == 0:
+            return cached
+
+        common = cached.index.intersection(fresh.index)
+        common = common[common >= start]
+        if not np.allclose(
+            cached.loc[common].to_numpy(dtype="float64"),
+            fresh.loc[common].to_numpy(dtype="float64"),
+            equal_nan=True,
+        ):
+            logger.warning(
+                f"Cached history of {self.api_object_id} changed, downloading it again."
+            )
+            if fresh.index[0] <= cached.index[0]:
+                return fresh
+            return self._download_history(index_name)
+
+        ts = pd.concat([cached[cached.index < fresh.index[0]], fresh])
+        ts.index.name = index_name
+        return ts.rename(fresh.name)
+
+    def _download_history(self, index_name: Optional[str], **params) -> pd.Series:
+        """
+        Download the valuation history of the object from API.
+        """
+        self.creation_response.wait_for_object_status()
+        api_response = self._environment.client.performance.history.get(
+            session_id=self._environment.session_id,
+            object_id=self.api_object_id,
+            **params,
+        )
+        return dict_to_series(
+            api_response.history, name=self.name, index_name=index_name
+        )
+
+    def invalidate_history(self) -> None:
+        """
+        Drop the history of the object from memory and from the environment's
+        history store, so that it is downloaded again on next use.
+        """
+        self._history = None
+        store = self._environment.history_store
+        key = self._content_hash() if store is not None else None
+        if store is not None and key is not None:
+            store.invalidate(key)
+
+
+def wait_for_objects(objects: Iterable[FrameworkApiObject]) -> None:
+    """
+    Wait for a collection of API objects to complete, polling all of them
+    together through the shared poller of the environment they were created in.
+
+    :param objects: The objects to wait for.
+    """
+    by_environment: Dict[Environment, List[FrameworkApiObject]] = {}
+    for o in objects:
+        # Objects known to have succeeded, e.g. waited for by ``obj.get_many``,
+        # are not polled again.
+        if o._status != "SUCCEEDED":
+            by_environment.setdefault(o.environment, []).append(o)
+    for environment, pending in by_environment.items():
+        results = environment.poller.wait_all([o.creation_response for o in pending])
+        for o, result in zip(pending, results):
+            o._status = result.d.get("status")
+
+
+def gather(
+    handles: Iterable[Union["Future[T]", T]], timeout: Optional[float] = None
+) -> List[T]:
+    """
+    Wait for many objects submitted for construction, e.g. with
+    ``Strategy.submit``, and for all of them to complete, polling them together
+    through the shared poller of their environment.
+
+    :param handles: Futures of the objects, or already constructed objects.
+    :param timeout: The maximum time to wait for each construction in seconds.
+        The completion of the objects is bounded by the client wait timeout.
+    :return: The completed objects, in input order.
+    """
+    objects = [h.result(timeout) if isinstance(h, Future) else h for h in handles]
+    wait_for_objects(objects)
+    return objects
+
+
+def prefetch_reference_data(
+    objects: Iterable[FrameworkApiObject], max_workers: int = 16
+) -> None:
+    """
+    Load reference data of many API objects concurrently, so that subsequent
+    reference data properties (e.g. ``currency`` or ``expiry_date``) are answered
+    locally.
+
+    :param objects: The objects to load reference data for.
+    :param max_workers: Maximum number of concurrent requests.
+    """
+    pending = [
+        o
+        for o in dict.fromkeys(objects)
+        if o._reference_data is None and not o._load_cached_reference_data()
+    ]
+    if not pending:
+        return
+    wait_for_objects(pending)
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="sigtech-reference-data"
+    ) as executor:
+        futures = [
+            submit_in_context(executor, o._fetch_reference_data) for o in pending
+        ]
+        for f in futures:
+            f.result()
@@ -0,0 +1,94 @@
+import logging
+import os
+import tempfile
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryStore:
+    """
+    Persistent store of history series in a local directory.
+
+    Every series is one uncompressed NumPy ``.npz`` file holding the timestamps
+    as ``datetime64[ns]`` and the values as ``float64``, so reading it back is a
+    plain binary copy. Files are written to a temporary file and atomically
+    renamed into place, so concurrent readers never see partial files.
+    """
+
+    suffix = ".npz"
+
+    def __init__(self, directory: str):
+        """
+        Initialize a HistoryStore.
+
+        :param directory: Directory to store series in. Created if missing.
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key: str) -> Optional[pd.Series]:
+        """
+        Read a series from the store.
+
+        :param key: The store key.
+        :return: The series, or None if it is not stored.
+        """
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                index = pd.DatetimeIndex(data["index"])
+                values = data["values"]
+                name = str(data["name"]) if data["name"].size else None
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable history {key}: {e}")
+            return None
+        return pd.Series(values, index=index, name=name)
+
+    def put(self, key: str, ts: pd.Series) -> None:
+        """
+        Write a series to the store, replacing any previous version.
+
+        :param key: The store key.
+        :param ts: Series with a datetime index and float values.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    index=ts.index.values.astype("datetime64[ns]"),
+                    values=ts.to_numpy(dtype="float64", na_value=np.nan),
+                    name=np.array([] if ts.name is None else str(ts.name)),
+                )
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a series from the store, if present.
+
+        :param key: The store key.
+        """
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """
+        Remove all series from the store.
+        """
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.suffix):
+                self.invalidate(entry.name[: -len(self.suffix)])
@@ -42,22 +42,11 @@ class TradableTSIndex(FrameworkApiObject):
         super().__init__(api_response)
         self._history: Optional[pd.Series] = None
 
-    def history(self) -> pd.Series:
+    def history(self, refresh: bool = False) -> pd.Series:
         """
         History of TradableTimeseries.
-        """
-        if self._history is not None:
-            return self._history
 
-        self.creation_response.wait_for_object_status()
-        api_response = env().client.performance.history.get(
-            session_id=env().session_id,
-            object_id=self.api_object_id,
-        )
-        df = pd.DataFrame(api_response.history).rename(
-            {"$timestamp": "date", "$history": "history"}, axis=1
-        )
-        ts = df.set_index("date")["history"].rename(self.name)
-        ts.index = pd.to_datetime(ts.index)
-        self._history = ts.sort_index()
-        return self._history
+        :param refresh: If True, download the points added since the history
+            was last fetched.
+        """
+        return self._get_history(refresh=refresh)
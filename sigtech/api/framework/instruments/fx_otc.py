@@ -74,19 +74,5 @@ class FXForward(Instrument):
             return self._strike
         return self._get_reference_data()["forwardRate"]
 
-    def history(self) -> pd.Series:
-        if self._history is not None:
-            return self._history
-        self.creation_response.wait_for_object_status()
-        api_response = env().client.performance.history.get(
-            session_id=env().session_id,
-            object_id=self.api_object_id,
-        )
-        df = pd.DataFrame(api_response.history).rename(
-            {"$timestamp": "date", "$history": "history"}, axis=1
-        )
-        ts = df.set_index("date")["history"].rename(self.name)
-        ts.index = pd.to_datetime(ts.index)
-        ts.index.name = None
-        self._history = ts.sort_index()
-        return self._history
+    def history(self, refresh: bool = False) -> pd.Series:
+        return self._get_history(index_name=None, refresh=refresh)
@@ -4,7 +4,7 @@ from typing import Optional, Union
 import pandas as pd
 
 from sigtech.api import env
-from sigtech.api.client.utils import date_from_iso_format
+from sigtech.api.client.utils import date_from_iso_format, dict_to_frame
 from sigtech.api.framework.instruments.base import Instrument
 
 
@@ -137,20 +137,19 @@ class InterestRateSwap(Instrument):
         if self._data_df is not None:
             return self._data_df
         self.creation_response.wait_for_object_status()
-        api_response = env().client.data.history.get(
-            session_id=env().session_id,
+        api_response = self.environment.client.data.history.get(
+            session_id=self.environment.session_id,
             object_id=self.api_object_id,
         )
-        data_df = pd.DataFrame(api_response.history).rename(
+        data_df = dict_to_frame(
+            api_response.history,
             columns={
-                "$timestamp": "trading_datetime",
                 "$history": "LastPrice",
                 "fairRate": "FairRate",
                 "pv01": "PV01",
-            }
+            },
+            index_name="trading_datetime",
         )
-        data_df = data_df.set_index("trading_datetime")
-        data_df.index = pd.to_datetime(data_df.index)
         self._data_df = data_df
         assert isinstance(self._data_df, pd.DataFrame)
         return self._data_df
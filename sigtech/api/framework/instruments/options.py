@@ -5,7 +5,7 @@ from typing import Literal, Optional, Union
 import pandas as pd
 
 from sigtech.api import env
-from sigtech.api.client.utils import date_from_iso_format
+from sigtech.api.client.utils import date_from_iso_format, dict_to_frame
 from sigtech.api.framework.instruments.base import Instrument
 
 
@@ -116,14 +116,14 @@ class EquityIndexOTCOption(Instrument):
             return self._metrics
 
         self.creation_response.wait_for_object_status()
-        api_response = env().client.data.history.get(
-            session_id=env().session_id,
+        api_response = self.environment.client.data.history.get(
+            session_id=self.environment.session_id,
             object_id=self.api_object_id,
         )
 
-        metrics_df = pd.DataFrame(api_response.history).rename(
+        metrics_df = dict_to_frame(
+            api_response.history,
             columns={
-                "$timestamp": "trading_datetime",
                 "$history": "NPV",
                 "delta": "Delta",
                 "gamma": "Gamma",
@@ -131,10 +131,9 @@ class EquityIndexOTCOption(Instrument):
                 "vega": "Vega",
                 "impliedVolatility": "ImpliedVolatility",
                 "premiumAdjustedDelta": "PA Delta",
-            }
+            },
+            index_name="trading_datetime",
         )
-        metrics_df = metrics_df.set_index("trading_datetime")
-        metrics_df.index = pd.to_datetime(metrics_df.index)
         self._metrics = metrics_df
         assert isinstance(self._metrics, pd.DataFrame)
         return self._metrics
@@ -263,14 +262,14 @@ class FXOTCOption(Instrument):
             return self._metrics
 
         self.creation_response.wait_for_object_status()
-        api_response = env().client.data.history.get(
-            session_id=env().session_id,
+        api_response = self.environment.client.data.history.get(
+            session_id=self.environment.session_id,
             object_id=self.api_object_id,
         )
 
-        metrics_df = pd.DataFrame(api_response.history).rename(
+        metrics_df = dict_to_frame(
+            api_response.history,
             columns={
-                "$timestamp": "trading_datetime",
                 "$history": "NPV",
                 "delta": "Delta",
                 "gamma": "Gamma",
@@ -278,10 +277,9 @@ class FXOTCOption(Instrument):
                 "vega": "Vega",
                 "impliedVolatility": "ImpliedVolatility",
                 "premiumAdjustedDelta": "PA Delta",
-            }
+            },
+            index_name="trading_datetime",
         )
-        metrics_df = metrics_df.set_index("trading_datetime")
-        metrics_df.index = pd.to_datetime(metrics_df.index)
         self._metrics = metrics_df
         assert isinstance(self._metrics, pd.DataFrame)
         return self._metrics
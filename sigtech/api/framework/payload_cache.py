@@ -0,0 +1,172 @@
+import json
+import logging
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Optional, Set, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_Key = Tuple[int, str]
+
+
+class PayloadCache:
+    """
+    Least recently used cache for data downloaded by API objects (history,
+    metrics, reference data), bounded by an approximate size in bytes.
+
+    Entries are dropped when their owning object is garbage collected. Evicted
+    entries read as None, so owners transparently fetch them again.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Initialize a PayloadCache.
+
+        :param max_bytes: Memory budget in bytes. Unbounded if None.
+        """
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[_Key, Tuple[Any, int]]" = OrderedDict()
+        self._owners: Set[int] = set()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate size of all cached payloads in bytes.
+        """
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, owner: Any, name: str) -> Any:
+        """
+        Retrieve a cached payload, marking it as recently used.
+
+        :param owner: The object owning the payload.
+        :param name: The payload name, e.g. ``'_history'``.
+        :return: The payload, or None if it is not cached.
+        """
+        key = (id(owner), name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, owner: Any, name: str, value: Any) -> None:
+        """
+        Store a payload, evicting least recently used payloads if the cache goes
+        over budget.
+
+        :param owner: The object owning the payload.
+        :param name: The payload name, e.g. ``'_history'``.
+        :param value: The payload. Storing None removes the entry.
+        """
+        self.discard(owner, name)
+        if value is None:
+            return
+        size = _nbytes(value)
+        with self._lock:
+            if self._max_bytes is not None and size > self._max_bytes:
+                logger.debug(f"Payload {name} of {size} bytes is not cached")
+                return
+            owner_id = id(owner)
+            if owner_id not in self._owners:
+                self._owners.add(owner_id)
+                weakref.finalize(owner, self._discard_owner, owner_id)
+            self._entries[(owner_id, name)] = (value, size)
+            self._nbytes += size
+            self._evict()
+
+    def discard(self, owner: Any, name: str) -> None:
+        """
+        Remove a payload from the cache, if present.
+
+        :param owner: The object owning the payload.
+        :param name: The payload name.
+        """
+        with self._lock:
+            entry = self._entries.pop((id(owner), name), None)
+            if entry is not None:
+                self._nbytes -= entry[1]
+
+    def clear(self) -> None:
+        """
+        Remove all payloads from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _discard_owner(self, owner_id: int) -> None:
+        with self._lock:
+            self._owners.discard(owner_id)
+            for key in [k for k in self._entries if k[0] == owner_id]:
+                self._nbytes -= self._entries.pop(key)[1]
+
+    def _evict(self) -> None:
+        if self._max_bytes is None:
+            return
+        while self._nbytes > self._max_bytes and self._entries:
+            key, (_, size) = self._entries.popitem(last=False)
+            self._nbytes -= size
+            logger.debug(f"Evicted payload {key[1]} of {size} bytes")
+
+
+class CachedPayload:
+    """
+    Descriptor storing an attribute of an API object in the object's
+    ``PayloadCache``.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            return self
+        cache = instance.__dict__.get("_payload_cache")
+        if cache is None:
+            return None
+        return cache.get(instance, self._name)
+
+    def __set__(self, instance, value: Any) -> None:
+        cache = instance.__dict__.get("_payload_cache")
+        if cache is None:
+            if value is not None:
+                raise AttributeError(f"{self._name} can not be set before init")
+            return
+        cache.put(instance, self._name, value)
+
+
+def _nbytes(value: Any) -> int:
+    """
+    Approximate memory footprint of a payload in bytes.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (dict, list)):
+        try:
+            return len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            pass
+    return sys.getsizeof(value)
@@ -1,16 +1,36 @@
 import datetime as dtm
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
-from sigtech.api.framework.environment import env
+from sigtech.api.client.pagination import (
+    DEFAULT_PAGE_SIZE,
+    column_array,
+    iter_pages,
+    read_columns,
+)
+from sigtech.api.client.utils import parse_timestamps
 
 logger = logging.getLogger(__name__)
 
 
+INDEX_COLUMNS = ["$timestamp", "level", "name"]
+POSITION_TYPES = [
+    "STRATEGY",
+    "STRATEGY_ORDER",
+    "GROUPED_ORDER",
+    "CASH",
+    "POSITION",
+    "ORDER",
+    "FX_SPOT_ORDER",
+]
+
+
 class PlotWrapper:
+    page_size = DEFAULT_PAGE_SIZE
+
     def __init__(self, strategy):
         super().__init__()
         self._strategy = strategy
@@ -23,7 +43,19 @@ class PlotWrapper:
         start_dt: Optional[dtm.datetime] = None,
         end_dt: Optional[dtm.datetime] = None,
         unit_type: Optional[str] = "MODEL",
+        page_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        max_level: Optional[int] = None,
+        types: Optional[List[str]] = None,
+        keep_columns: Optional[List[str]] = None,
     ):
+        """
+        Portfolio history of the strategy.
+
+        ``columns``, ``max_level`` and ``types`` are requested from the API as a
+        projection, ``keep_columns`` only selects the columns of the downloaded
+        pages.
+        """
         valid_dts = {
             "VALUATION_PTS": "VALUATION",
             "ACTION_PTS": "ACTION",
@@ -35,66 +67,75 @@ class PlotWrapper:
         except KeyError:
             raise ValueError(f"dts must be one of: {list(valid_dts)}")
 
-        if tzinfo is not None:
-            raise ValueError("tzinfo must be None")
-        if start_dt is not None:
-            raise ValueError("start_dt must be None")
-        if end_dt is not None:
-            raise ValueError("end_dt must be None")
+        start = _to_utc(start_dt, tzinfo)
+        end = _to_utc(end_dt, tzinfo)
+        if start is not None and end is not None and start > end:
+            raise ValueError("start_dt must not be after end_dt")
+        window = {}
+        if start is not None:
+            window["start_date"] = start.isoformat()
+        if end is not None:
+            window["end_date"] = end.isoformat()
         if unit_type not in ("MODEL", "TRADE"):
             raise ValueError("unit_type must be 'MODEL' or 'TRADE'")
 
+        projection: Dict[str, Any] = {}
+        if columns is not None:
+            columns = list(dict.fromkeys(INDEX_COLUMNS + list(columns)))
+            projection["columns"] = columns
+        if max_level is not None:
+            projection["max_level"] = max_level
+        if types is not None:
+            invalid = set(types) - set(POSITION_TYPES)
+            if invalid:
+                raise ValueError(f"types must be in {POSITION_TYPES}: {invalid}")
+            projection["types"] = list(types)
+
         logger.debug("Waiting for strategy to complete.")
         self._strategy.creation_response.wait_for_object_status()
 
         logger.debug("Create portfolio analytics object")
-        resp = env().client.analytics.portfolio.create(
-            session_id=env().session_id,
+        environment = self._strategy.environment
+        resp = environment.client.analytics.portfolio.create(
+            session_id=environment.session_id,
             strategy=self._strategy.api_object_id,
             points=points,
             flatten=flatten,
+            **window,
+            **projection,
         )
         resp.wait_for_object_status()
         logger.debug("Done creating portfolio analytics object")
 
-        page_size = 25_000
-
-        # Fetch all history pages
+        # Fetch all history pages, decoding each page while fetching the next
         logger.debug("Fetching history for portfolio analytics object")
-        page = env().client.performance.history.get(
-            session_id=env().session_id,
-            object_id=resp.object_id,
+        page_size = page_size or self.page_size
+        pages = iter_pages(
+            environment.client.performance.history,
             page_size=page_size,
+            session_id=environment.session_id,
+            object_id=resp.object_id,
+            **window,
         )
-        history = page.history
-        while "next_page_id" in page.d:
-            logger.debug(
-                "Fetching next history page for "
-                f"portfolio analytics object: {page.next_page_id}."
-            )
-            page = env().client.performance.history.get(
-                session_id=env().session_id,
-                object_id=resp.object_id,
-                page_size=page_size,
-                page_id=page.next_page_id,
-            )
-            _update_history(history, page.history)
-        history["$timestamp"] = pd.DatetimeIndex(history["$timestamp"])
-        history["executionTime"] = pd.DatetimeIndex(history["executionTime"])
-        history["type"] = pd.Categorical(
-            history["type"],
-            categories=[
-                "STRATEGY",
-                "STRATEGY_ORDER",
-                "GROUPED_ORDER",
-                "CASH",
-                "POSITION",
-                "ORDER",
-                "FX_SPOT_ORDER",
-            ],
+        # The window and projection are applied again to each page as it
+        # arrives, in case they are not supported by the API.
+        if keep_columns is not None:
+            keep = list(dict.fromkeys(INDEX_COLUMNS + list(keep_columns)))
+            columns = keep if columns is None else [c for c in columns if c in keep]
+        page_filter = _PageFilter(start, end, columns, max_level, types)
+        history: Dict[str, Any] = read_columns(
+            (page_filter(page.history) for page in pages),
+            capacity=page_size,
         )
+        for k in ("$timestamp", "executionTime"):
+            if k in history:
+                history[k] = parse_timestamps(history[k])
+                if tzinfo is not None:
+                    history[k] = _convert_tz(history[k], tzinfo)
+        if "type" in history:
+            history["type"] = pd.Categorical(history["type"], categories=POSITION_TYPES)
         df = pd.DataFrame(history)
-        df = df.set_index(["$timestamp", "level", "name"])
+        df = df.set_index(INDEX_COLUMNS)
         return df
 
     def portfolio_table(
@@ -106,18 +147,23 @@ class PlotWrapper:
         end_dt: Optional[dtm.datetime] = None,
         unit_type: Optional[str] = "MODEL",
         as_df: bool = False,
+        page_size: Optional[int] = None,
+        typed: bool = False,
+        max_level: Optional[int] = None,
+        types: Optional[List[str]] = None,
     ):
+        """
+        Portfolio table of the strategy, in the format of the SigTech framework.
+
+        :param typed: If True, keep the datetime, float and categorical dtypes of
+            the columns instead of formatting all values as display strings.
+        :param max_level: Only include rows up to this level of the strategy
+            hierarchy, where 0 is the top level.
+        :param types: Only include rows of these position types, e.g.
+            ``['POSITION']``.
+        """
         if as_df is not True:
             raise ValueError("as_df must be True")
-        df = self._portfolio_df(
-            dts=dts,
-            tzinfo=tzinfo,
-            flatten=flatten,
-            start_dt=start_dt,
-            end_dt=end_dt,
-            unit_type=unit_type,
-        )
-        df = df.reset_index()
 
         # Transform to framework format
         if unit_type == "MODEL":
@@ -126,22 +172,34 @@ class PlotWrapper:
             units_column = "tradeQuantity"
         else:
             raise NotImplementedError
-        df = df[
-            [
-                "$timestamp",
-                "name",
-                "level",
-                "executionTime",
-                "weight",
-                "exposureWeight",
-                "valuation",
-                units_column,
-                "value",
-                "valueLocal",
-                "type",
-            ]
+        columns = [
+            "$timestamp",
+            "name",
+            "level",
+            "executionTime",
+            "weight",
+            "exposureWeight",
+            "valuation",
+            units_column,
+            "value",
+            "valueLocal",
+            "type",
         ]
-        df["type"] = df["type"].replace(
+        df = self._portfolio_df(
+            dts=dts,
+            tzinfo=tzinfo,
+            flatten=flatten,
+            start_dt=start_dt,
+            end_dt=end_dt,
+            unit_type=unit_type,
+            page_size=page_size,
+            max_level=max_level,
+            types=types,
+            keep_columns=columns,
+        )
+        df = df.reset_index()
+        df = df[columns]
+        df["type"] = df["type"].cat.rename_categories(
             {
                 "STRATEGY": "Strategy",
                 "STRATEGY_ORDER": "Strategy Order",
@@ -167,25 +225,113 @@ class PlotWrapper:
                 "type": "Position Type",
             }
         )
-        dt_cols = df.select_dtypes(include=["datetime64[ns]"]).columns
-        df[dt_cols] = (
-            df[dt_cols]
-            .apply(lambda o: o.dt.strftime("%Y/%m/%d, %H:%M:%S"), axis="columns")
-            .replace(np.nan, "-")
-        )
-        float_cols = df.select_dtypes(include=["floating"]).columns
-        weight_cols = [o for o in float_cols if "weight" in o.lower()]
-        df[float_cols] = df[float_cols].round(3).astype(str)
-        df[weight_cols] = df[weight_cols] + "%"
-        df[float_cols] = df[float_cols].replace(["nan", "nan%"], "-")
-        df = df.replace([None, np.nan], "-")
+        if not typed:
+            df = _format_table(df)
         df = df.set_index(["Date", "Name", "Level"])
         return df
 
 
-def _update_history(history, d):
-    assert history.keys() == d.keys()
-    for k, v in history.items():
-        assert isinstance(k, str)
-        assert isinstance(v, list)
-        v.extend(d[k])
+def _to_utc(dt: Optional[dtm.datetime], tzinfo=None) -> Optional[pd.Timestamp]:
+    """
+    Convert a datetime to a naive UTC timestamp. Naive datetimes are in
+    ``tzinfo``, or in UTC if ``tzinfo`` is None.
+    """
+    if dt is None:
+        return None
+    ts = pd.Timestamp(dt)
+    if ts.tz is None:
+        if tzinfo is None:
+            return ts
+        ts = ts.tz_localize(tzinfo)
+    return ts.tz_convert("UTC").tz_localize(None)
+
+
+def _convert_tz(index: pd.DatetimeIndex, tzinfo) -> pd.DatetimeIndex:
+    if index.tz is None:
+        index = index.tz_localize("UTC")
+    return index.tz_convert(tzinfo)
+
+
+class _PageFilter:
+    """
+    Select the rows and columns of history pages.
+    """
+
+    def __init__(
+        self,
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        columns: Optional[List[str]] = None,
+        max_level: Optional[int] = None,
+        types: Optional[List[str]] = None,
+    ):
+        self.start = start
+        self.end = end
+        self.columns = columns
+        self.max_level = max_level
+        self.types = types
+
+    def __call__(self, history: Dict[str, Any]) -> Dict[str, Any]:
+        n = len(history["$timestamp"])
+        mask = np.ones(n, dtype=bool)
+        if self.start is not None or self.end is not None:
+            # Only used for filtering: ``$timestamp`` is kept in the format of
+            # the response, so that it is the same on all pages.
+            timestamps = parse_timestamps(history["$timestamp"])
+            if timestamps.tz is not None:
+                timestamps = timestamps.tz_convert("UTC").tz_localize(None)
+            if self.start is not None:
+                mask &= timestamps.values >= self.start.to_datetime64()
+            if self.end is not None:
+                mask &= timestamps.values <= self.end.to_datetime64()
+        if self.max_level is not None:
+            mask &= column_array(history["level"]) <= self.max_level
+        if self.types is not None:
+            mask &= np.isin(column_array(history["type"]), self.types)
+        # Columns are projected after the rows are selected, since the row
+        # filters may need columns which are not kept.
+        if self.columns is not None:
+            history = {k: v for (k, v) in history.items() if k in self.columns}
+        if mask.all():
+            return history
+        rows = np.flatnonzero(mask)
+        return {k: column_array(v)[rows] for (k, v) in history.items()}
+
+
+def _format_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Format the values of a portfolio table as display strings, with ``'-'`` for
+    missing values.
+    """
+    columns: Dict[Any, Any] = {}
+    for name, s in df.items():
+        if pd.api.types.is_datetime64_any_dtype(s):
+            columns[name] = _format_datetimes(s)
+        elif pd.api.types.is_float_dtype(s):
+            suffix = "%" if "weight" in str(name).lower() else ""
+            columns[name] = _format_floats(s.to_numpy(dtype="float64"), suffix)
+        elif isinstance(s.dtype, pd.CategoricalDtype):
+            if "-" not in s.cat.categories:
+                s = s.cat.add_categories("-")
+            columns[name] = s.fillna("-")
+        elif s.dtype == object:
+            columns[name] = s.where(s.notna(), "-").to_numpy()
+        else:
+            columns[name] = s
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _format_datetimes(s: pd.Series) -> np.ndarray:
+    # Timestamps repeat across the rows of a date, so only unique values are
+    # formatted.
+    codes, uniques = pd.factorize(s)
+    dates = pd.DatetimeIndex(uniques).strftime("%Y/%m/%d, %H:%M:%S")
+    return np.append(dates.to_numpy(dtype=object), "-")[codes]
+
+
+def _format_floats(values: np.ndarray, suffix: str = "") -> np.ndarray:
+    labels = np.round(values, 3).astype(str).astype(object)
+    if suffix:
+        labels += suffix
+    labels[np.isnan(values)] = "-"
+    return labels
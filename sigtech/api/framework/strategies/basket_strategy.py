@@ -3,7 +3,10 @@ from typing import List, Optional, Union, cast
 
 from sigtech.api.client.response import Response
 from sigtech.api.framework.environment import env, obj
-from sigtech.api.framework.framework_api_object import FrameworkApiObject
+from sigtech.api.framework.framework_api_object import (
+    FrameworkApiObject,
+    wait_for_objects,
+)
 from sigtech.api.framework.strategies.strategy import Strategy
 
 
@@ -32,12 +35,13 @@ class BasketStrategy(Strategy):
         start_date: Optional[Union[str, dtm.date]] = None,
         ticker: Optional[str] = None,
     ):
+        names = [x for x in constituent_names if isinstance(x, str)]
+        instruments = dict(zip(names, obj.get_many(names)))
         constituents: List[FrameworkApiObject] = [
-            cast(FrameworkApiObject, obj.get(x) if isinstance(x, str) else x)
+            cast(FrameworkApiObject, instruments[x] if isinstance(x, str) else x)
             for x in constituent_names
         ]
-        for fapi_obj in constituents:
-            fapi_obj.creation_response.wait_for_object_status()
+        wait_for_objects(constituents)
         constituent_ids = [x.api_object_id for x in constituents]
         start_date = str(start_date) if isinstance(start_date, dtm.date) else start_date
         super().__init__(
@@ -48,6 +52,8 @@ class BasketStrategy(Strategy):
             start_date=start_date,
             ticker=ticker,
         )
+        # Keep the constituents alive while the strategy is in use.
+        self._constituents = constituents
 
     def _get_strategy_obj(self, session_id: str, **inputs) -> Response:
         """
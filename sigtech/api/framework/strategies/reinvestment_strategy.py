@@ -54,7 +54,7 @@ class ReinvestmentStrategy(Strategy):
             **api_inputs,
         )
 
-    def history(self) -> pd.Series:
+    def history(self, refresh: bool = False) -> pd.Series:
         """
         Returns the valuation history of the strategy
         (Not available for stocks and ETFs).
@@ -1,13 +1,112 @@
 import datetime as dtm
-from typing import Optional, Union, cast
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Union, cast
 
+import numpy as np
 import pandas as pd
+import requests
 
 from sigtech.api.client.response import Response
 from sigtech.api.framework.environment import env, obj
-from sigtech.api.framework.framework_api_object import FrameworkApiObject
+from sigtech.api.framework.framework_api_object import (
+    FrameworkApiObject,
+    wait_for_objects,
+)
 from sigtech.api.framework.strategies.strategy import Strategy
 
+logger = logging.getLogger(__name__)
+
+
+class SignalValidationError(ValueError):
+    """
+    Raised when a signal is invalid. ``problems`` lists every problem found.
+    """
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__("Invalid signal:\n" + "\n".join(f"- {p}" for p in problems))
+
+
+def validate_signal(
+    signal_input: pd.DataFrame,
+    max_gross_weight: Optional[float] = None,
+    raise_errors: bool = True,
+) -> List[str]:
+    """
+    Check a signal locally, without any API call. Missing (NaN) weights are
+    valid, but infinite weights are not, since they can not be sent to the API.
+
+    :param signal_input: DataFrame of weights through time.
+    :param max_gross_weight: Maximum sum of absolute weights of any timestamp.
+        Not checked if None.
+    :param raise_errors: If True, raise ``SignalValidationError`` if any problem
+        is found.
+    :return: List of the problems found.
+    """
+    problems = []
+
+    def examples(labels) -> str:
+        labels = [repr(x) if isinstance(x, str) else str(x) for x in labels]
+        more = f" and {len(labels) - 5} more" if len(labels) > 5 else ""
+        return ", ".join(labels[:5]) + more
+
+    index = signal_input.index
+    columns = signal_input.columns
+    if len(index) == 0 or len(columns) == 0:
+        problems.append("signal is empty")
+    if not isinstance(index, pd.DatetimeIndex):
+        problems.append(f"index must be a DatetimeIndex, not {type(index).__name__}")
+    else:
+        if index.hasnans:
+            problems.append("index contains missing timestamps")
+        if index.has_duplicates:
+            duplicated = index[index.duplicated()].unique()
+            problems.append(f"duplicate timestamps: {examples(duplicated)}")
+        elif not index.is_monotonic_increasing:
+            problems.append("index is not sorted in increasing order")
+
+    invalid = [c for c in columns if not isinstance(c, str) or not c.strip()]
+    if invalid:
+        problems.append(f"invalid instrument identifiers: {examples(invalid)}")
+    if columns.has_duplicates:
+        problems.append(
+            f"duplicate instruments: {examples(columns[columns.duplicated()].unique())}"
+        )
+
+    non_numeric = [
+        c
+        for (c, dtype) in signal_input.dtypes.items()
+        if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)
+    ]
+    if non_numeric:
+        problems.append(f"non-numeric weights for: {examples(non_numeric)}")
+    elif len(index) > 0 and len(columns) > 0:
+        values = signal_input.to_numpy(dtype="float64")
+        missing = np.isnan(values)
+        all_missing = columns[missing.all(axis=0)]
+        if len(all_missing):
+            problems.append(f"instruments without any weight: {examples(all_missing)}")
+        infinite = np.isinf(values)
+        if infinite.any():
+            problems.append(
+                "infinite weights for: "
+                f"{examples(columns[infinite.any(axis=0)].unique())}"
+            )
+        if max_gross_weight is not None:
+            gross = np.nansum(np.abs(np.where(infinite, 0, values)), axis=1)
+            too_large = index[gross > max_gross_weight]
+            if len(too_large):
+                problems.append(
+                    f"sum of absolute weights above {max_gross_weight} on "
+                    f"{len(too_large)} timestamps: {examples(too_large)}"
+                )
+
+    if problems and raise_errors:
+        raise SignalValidationError(problems)
+    return problems
+
 
 class SignalStrategy(Strategy):
     """
@@ -23,8 +122,20 @@ class SignalStrategy(Strategy):
                             (optional) defaults to 'EOM'.
     :param start_date: Start of strategy (optional).
     :param ticker: Name of strategy (optional).
+    :param signal_encoding: Encoding of the signal sent to the API: ``'dense'``,
+                    or, if supported by the API, ``'columnar'`` (missing
+                    weights are omitted), ``'sparse'`` (only non-zero weights
+                    are sent) or ``'delta'`` (only the timestamps where weights
+                    change are sent). Falls back to ``'dense'`` if the encoding
+                    is rejected, (optional) defaults to 'dense'.
+    :param max_gross_weight: Maximum sum of absolute weights of any timestamp,
+                    checked before any API call, (optional).
     """
 
+    # Strategies are memoized by a digest of the signal arrays, much faster than
+    # hashing the encoded signal. The dense fallback is derived from the signal.
+    _unhashed_inputs = ("signal", "dense_signal")
+
     def __init__(
         self,
         signal_input: pd.DataFrame,
@@ -32,39 +143,195 @@ class SignalStrategy(Strategy):
         rebalance_frequency: str = "EOM",
         start_date: Optional[Union[str, dtm.date]] = None,
         ticker: Optional[str] = None,
+        signal_encoding: str = "dense",
+        max_gross_weight: Optional[float] = None,
     ):
-        signal_input = signal_input.copy()
-        constituents = [obj.get(x) for x in signal_input.columns]
-        for fapi_obj in constituents:
-            cast(
-                FrameworkApiObject, fapi_obj
-            ).creation_response.wait_for_object_status()
-        signal_input.columns = pd.Index(
-            [cast(FrameworkApiObject, x).api_object_id for x in constituents]
-        )
+        if signal_encoding not in SIGNAL_ENCODERS:
+            raise ValueError(f"signal_encoding must be one of {list(SIGNAL_ENCODERS)}")
+        validate_signal(signal_input, max_gross_weight=max_gross_weight)
         assert isinstance(signal_input.index, pd.DatetimeIndex)
-        signal_input.index = signal_input.index.strftime("%Y-%m-%dT%H:%M:%S")
-        signal_input.index.name = "$timestamp"
-        signal_input_json = signal_input.reset_index().to_dict(orient="list")
+        constituents = [
+            cast(FrameworkApiObject, x) for x in obj.get_many(signal_input.columns)
+        ]
+        wait_for_objects(constituents)
+        index = signal_input.index
+        columns = [x.api_object_id for x in constituents]
+        values = signal_input.to_numpy(dtype="float64")
+        signal = SIGNAL_ENCODERS[signal_encoding](index, columns, values)
         start_date = str(start_date) if isinstance(start_date, dtm.date) else start_date
+        dense = signal_encoding == "dense"
         super().__init__(
-            signal=signal_input_json,
+            signal=signal,
+            signal_digest=signal_digest(index, columns, values),
+            signal_encoding=None if dense else signal_encoding,
+            dense_signal=(
+                None if dense else lambda: dense_signal(index, columns, values)
+            ),
             currency=currency,
             rebalance_frequency=rebalance_frequency,
             start_date=start_date,
             ticker=ticker,
         )
+        # Keep the constituents alive while the strategy is in use.
+        self._constituents = constituents
+
+    @staticmethod
+    def validate(
+        signal_input: pd.DataFrame, max_gross_weight: Optional[float] = None
+    ) -> List[str]:
+        """
+        Check a signal locally, without creating the strategy.
+
+        :param signal_input: DataFrame of weights through time.
+        :param max_gross_weight: Maximum sum of absolute weights of any
+            timestamp, (optional).
+        :return: List of the problems found, empty if the signal is valid.
+        """
+        return validate_signal(
+            signal_input, max_gross_weight=max_gross_weight, raise_errors=False
+        )
 
     def _get_strategy_obj(self, session_id: str, **inputs) -> Response:
         """
         Fetch signal strategy from API.
         """
         api_inputs = {k: v for k, v in inputs.items() if v is not None}
+        fallback = api_inputs.pop("dense_signal", None)
+        api_inputs.pop("signal_digest", None)
 
         if "ticker" in api_inputs:
             api_inputs["name"] = api_inputs["ticker"] + " STRATEGY"
             del api_inputs["ticker"]
 
-        return env().client.strategies.signal.create(
-            session_id=session_id, **api_inputs
-        )
+        client = env().client.strategies.signal
+        try:
+            return client.create(session_id=session_id, **api_inputs)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if fallback is None or status not in (400, 415, 422):
+                raise
+            logger.warning(
+                f"Signal encoding {api_inputs['signal_encoding']} was rejected, "
+                "sending the dense signal instead."
+            )
+        api_inputs["signal"] = fallback()
+        del api_inputs["signal_encoding"]
+        return client.create(session_id=session_id, **api_inputs)
+
+
+def _timestamps(index: pd.DatetimeIndex) -> List[str]:
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return np.datetime_as_string(index.values, unit="s").tolist()
+
+
+def signal_digest(
+    index: pd.DatetimeIndex, columns: List[str], values: np.ndarray
+) -> str:
+    """
+    Digest of a signal, identifying it in memoization keys.
+
+    :param index: Timestamps of the signal.
+    :param columns: Object IDs of the instruments.
+    :param values: Weights, one row per timestamp and one column per instrument.
+    :return: Hex digest of the signal.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps([str(index.dtype), list(columns), values.shape]).encode())
+    h.update(np.ascontiguousarray(index.values).view("int64").tobytes())
+    h.update(np.ascontiguousarray(values, dtype="float64").tobytes())
+    return h.hexdigest()
+
+
+def dense_signal(
+    index: pd.DatetimeIndex, columns: List[str], values: np.ndarray
+) -> Dict[str, Any]:
+    """
+    Dense encoding of a signal, with one list of weights per instrument.
+    Missing weights are sent as nulls.
+
+    :param index: Timestamps of the signal.
+    :param columns: Object IDs of the instruments.
+    :param values: Weights, one row per timestamp and one column per instrument.
+    :return: The encoded signal.
+    """
+    signal: Dict[str, Any] = {"$timestamp": _timestamps(index)}
+    finite = np.isfinite(values)
+    for j, column in enumerate(columns):
+        weights = values[:, j]
+        if not finite[:, j].all():
+            # NaN is not valid JSON.
+            weights = weights.astype(object)
+            weights[~finite[:, j]] = None
+        signal[column] = weights.tolist()
+    return signal
+
+
+def columnar_signal(
+    index: pd.DatetimeIndex, columns: List[str], values: np.ndarray
+) -> Dict[str, Any]:
+    """
+    Columnar encoding of a signal. Timestamps are shared by all instruments and
+    every instrument lists the (row, weight) pairs of its non-missing weights.
+
+    :param index: Timestamps of the signal.
+    :param columns: Object IDs of the instruments.
+    :param values: Weights, one row per timestamp and one column per instrument.
+    :return: The encoded signal.
+    """
+    present = ~np.isnan(values)
+    signal: Dict[str, Any] = {"$timestamp": _timestamps(index), "columns": {}}
+    for j, column in enumerate(columns):
+        rows = np.flatnonzero(present[:, j])
+        signal["columns"][column] = {
+            "rows": rows.tolist(),
+            "values": values[rows, j].tolist(),
+        }
+    return signal
+
+
+def sparse_signal(
+    index: pd.DatetimeIndex, columns: List[str], values: np.ndarray
+) -> Dict[str, Any]:
+    """
+    Sparse encoding of a signal, as (row, instrument, weight) triplets of the
+    non-zero weights. Missing and zero weights are omitted.
+
+    :param index: Timestamps of the signal.
+    :param columns: Object IDs of the instruments.
+    :param values: Weights, one row per timestamp and one column per instrument.
+    :return: The encoded signal.
+    """
+    rows, cols = np.nonzero((values != 0) & ~np.isnan(values))
+    return {
+        "$timestamp": _timestamps(index),
+        "instruments": list(columns),
+        "rows": rows.tolist(),
+        "instrumentIndex": cols.tolist(),
+        "values": values[rows, cols].tolist(),
+    }
+
+
+def delta_signal(
+    index: pd.DatetimeIndex, columns: List[str], values: np.ndarray
+) -> Dict[str, Any]:
+    """
+    Delta encoding of a signal: the dense encoding of the rows where any weight
+    differs from the previous row. Weights hold until the next row sent.
+
+    :param index: Timestamps of the signal.
+    :param columns: Object IDs of the instruments.
+    :param values: Weights, one row per timestamp and one column per instrument.
+    :return: The encoded signal.
+    """
+    same = (values[1:] == values[:-1]) | (np.isnan(values[1:]) & np.isnan(values[:-1]))
+    changed = np.concatenate([[True], ~same.all(axis=1)])[: len(values)]
+    return dense_signal(index[changed], columns, values[changed])
+
+
+SIGNAL_ENCODERS = {
+    "dense": dense_signal,
+    "columnar": columnar_signal,
+    "sparse": sparse_signal,
+    "delta": delta_signal,
+}
@@ -1,13 +1,21 @@
+import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
 
 import pandas as pd
+import requests
 
 from sigtech.api.client.response import Response
-from sigtech.api.framework.environment import env
+from sigtech.api.framework.disk_cache import content_hash
+from sigtech.api.framework.environment import Environment, env, submit_in_context
 from sigtech.api.framework.framework_api_object import FrameworkApiObject
 from sigtech.api.framework.plot_wrapper import PlotWrapper
 
+logger = logging.getLogger(__name__)
+
+S = TypeVar("S", bound="Strategy")
+
 
 class Strategy(FrameworkApiObject, ABC):
     """
@@ -16,10 +24,49 @@ class Strategy(FrameworkApiObject, ABC):
     This is a base class for different strategy classes.
     """
 
+    # Inputs which are left out of the memoization key, e.g. because they are
+    # derived from other inputs.
+    _unhashed_inputs: Tuple[str, ...] = ()
+
     def __init__(self, **inputs) -> None:
-        api_response = self._get_strategy_obj(env().session_id, **inputs)
+        environment = env()
+        session_id = environment.session_id
+        if environment.memoize_strategies:
+            api_response = _memoized_strategy_obj(
+                environment,
+                type(self),
+                inputs,
+                lambda: self._get_strategy_obj(session_id, **inputs),
+            )
+        else:
+            api_response = self._get_strategy_obj(session_id, **inputs)
+        # An identical strategy object shares its downloaded history.
+        existing = environment.objects_by_id.get(api_response.d.get("object_id", ""))
         super().__init__(api_response)
         self._history: Optional[pd.Series] = None
+        if isinstance(existing, Strategy):
+            self._history = existing._history
+
+    @classmethod
+    def submit(cls: Type[S], *args, **kwargs) -> "Future[S]":
+        """
+        Construct a strategy in the background, without waiting for its
+        constituents or its creation request. Wait for many submitted strategies
+        together with ``gather``:
+
+        ::
+
+            futures = [sig.BasketStrategy.submit(...) for w in weights]
+            strategies = sig.gather(futures)
+
+        :param args: Positional arguments of the strategy constructor.
+        :param kwargs: Keyword arguments of the strategy constructor.
+        :return: A future resolving to the strategy.
+        """
+        environment = env()
+        # Create the session up front, not from the worker threads
+        _ = environment.session_id
+        return submit_in_context(environment.executor, cls, *args, **kwargs)
 
     @abstractmethod
     def _get_strategy_obj(self, session_id: str, **inputs) -> Response:
@@ -29,26 +76,117 @@ class Strategy(FrameworkApiObject, ABC):
         """
         raise NotImplementedError
 
-    def history(self) -> pd.Series:
+    def history(self, refresh: bool = False) -> pd.Series:
         """
         Returns the valuation history of the strategy.
-        """
-        if self._history is not None:
-            return self._history
 
-        self.creation_response.wait_for_object_status()
-        api_response = env().client.performance.history.get(
-            session_id=env().session_id,
-            object_id=self.api_object_id,
-        )
-        df = pd.DataFrame(api_response.history).rename(
-            {"$timestamp": "date", "$history": "history"}, axis=1
-        )
-        ts = df.set_index("date")["history"].rename(self.name)
-        ts.index = pd.to_datetime(ts.index)
-        self._history = ts.sort_index()
-        return self._history
+        :param refresh: If True, download the points added since the history
+            was last fetched.
+        """
+        return self._get_history(refresh=refresh)
 
     @property
     def plot(self):
         return PlotWrapper(self)
+
+
+def _memoized_strategy_obj(
+    environment: Environment,
+    cls: Type[Strategy],
+    inputs: Dict[str, Any],
+    create: Callable[[], Response],
+) -> Response:
+    """
+    Creation response of a strategy, reused from an identical strategy created
+    earlier in the same session, if any.
+    """
+    key = content_hash(
+        f"{cls.__module__}.{cls.__qualname__}",
+        {
+            k: v
+            for (k, v) in inputs.items()
+            if v is not None and k not in cls._unhashed_inputs
+        },
+        environment.session_settings(),
+        environment.session_id,
+    )
+
+    def load_or_create() -> Response:
+        # Only object IDs are memoized, the creation response is reused from
+        # the strategy object while it is alive.
+        object_id = environment.strategy_memo.get(key)
+        existing = environment.objects_by_id.get(object_id) if object_id else None
+        response = None
+        if existing is not None:
+            response = existing.creation_response
+            if (
+                existing._status != "SUCCEEDED"
+                and response.d.get("status") != "SUCCEEDED"
+                and _latest_status(response, key) == "FAILED"
+            ):
+                # Build failed strategies again, e.g. after a transient failure.
+                if environment.strategy_cache is not None:
+                    environment.strategy_cache.delete(key)
+                response = None
+        if response is None:
+            response = _load_strategy_obj(environment, key)
+        if response is None:
+            response = create()
+            _store_strategy_obj(environment, key, response)
+        environment.strategy_memo[key] = response.d.get("object_id")
+        return response
+
+    return environment._strategy_flight.do(key, load_or_create)
+
+
+def _load_strategy_obj(environment: Environment, key: str) -> Optional[Response]:
+    cache = environment.strategy_cache
+    entry = cache.get(key) if cache is not None else None
+    if entry is None:
+        return None
+    assert cache is not None
+    response = Response(
+        entry["d"],
+        name=entry["name"],
+        client=environment.client.with_path(entry["path"]),
+        kwargs=entry["kwargs"],
+    )
+    status = _latest_status(response, key)
+    if status is None or status == "FAILED":
+        cache.delete(key)
+        return None
+    return response
+
+
+def _latest_status(response: Response, key: str) -> Optional[str]:
+    """
+    Latest status of a memoized strategy, or None if it is not available.
+    """
+    try:
+        return response.latest_object_response().d.get("status")
+    except (requests.RequestException, ValueError) as e:
+        logger.debug(f"Memoized strategy {key} is not available: {e}")
+        return None
+
+
+def _store_strategy_obj(environment: Environment, key: str, response: Response) -> None:
+    cache = environment.strategy_cache
+    if cache is None:
+        return
+    url = getattr(response.client, "url", None)
+    prefix = f"{environment.client.url}/"
+    if not isinstance(url, str) or not url.startswith(prefix):
+        return
+    path = url.split(prefix, 1)[1]
+    try:
+        cache.put(
+            key,
+            {
+                "d": response.d,
+                "name": response.api_name,
+                "path": path,
+                "kwargs": response.kwargs,
+            },
+        )
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Strategy {key} is not cached: {e}")
@@ -0,0 +1,31 @@
+from unittest.mock import Mock
+
+import pytest
+
+from sigtech.api.client.response import Response
+from sigtech.api.framework import environment
+from sigtech.api.framework.environment import Environment
+
+
+@pytest.fixture
+def mock_env(monkeypatch):
+    client = Mock()
+    client.sessions.create.return_value = Response({"sessionId": "sess"})
+
+    def create_instrument(session_id, identifier):
+        return Response(
+            {
+                "objectId": f"id-{identifier}",
+                "status": "SUCCEEDED",
+                "type": "Index",
+                "name": identifier,
+            },
+            client=client.instruments,
+            kwargs={"session_id": session_id, "identifier": identifier},
+        )
+
+    client.instruments.url = "http://test.url/instruments"
+    client.instruments.create.side_effect = create_instrument
+    e = Environment(client)
+    monkeypatch.setattr(environment, "_GLOBAL_ENVIRONMENT", e)
+    return e
@@ -0,0 +1,143 @@
+import asyncio
+import copy
+
+import pytest
+
+from sigtech.api.client.response import Response
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from sigtech.api.client.async_client import AsyncClient  # noqa: E402
+
+
+def _stub_app():
+    polls = {"count": 0}
+
+    async def create(request):
+        body = await request.json()
+        return web.json_response({"objectId": "obj1", "status": "RUNNING", **body})
+
+    async def listing(request):
+        return web.json_response({"strategies": [{"objectId": "obj1"}]})
+
+    async def get(request):
+        return web.json_response(
+            {"objectId": request.match_info["id"], "query": dict(request.query)}
+        )
+
+    async def delete(request):
+        return web.json_response({"deleted": request.match_info["id"]})
+
+    async def query_object(request):
+        polls["count"] += 1
+        status = "SUCCEEDED" if polls["count"] >= 2 else "RUNNING"
+        return web.json_response(
+            {"objectId": request.match_info["object_id"], "status": status}
+        )
+
+    async def not_found(request):
+        return web.json_response({"error": "missing"}, status=404)
+
+    app = web.Application()
+    app.router.add_post("/strategies", create)
+    app.router.add_get("/strategies", listing)
+    app.router.add_get("/strategies/{id}", get)
+    app.router.add_delete("/strategies/{id}", delete)
+    app.router.add_get("/sessions/{session_id}/objects/{object_id}", query_object)
+    app.router.add_get("/missing", not_found)
+    return app, polls
+
+
+def _run(test):
+    async def runner():
+        app, polls = _stub_app()
+        async with TestServer(app) as server:
+            url = str(server.make_url("")).rstrip("/")
+            async with AsyncClient(api_key="apikey", url=url) as client:
+                await test(client, polls)
+
+    asyncio.run(runner())
+
+
+def test_async_crud():
+    async def test(client, polls):
+        r = await client.strategies.create(session_id="sess", rolling_rule="front")
+        assert isinstance(r, Response)
+        assert r.object_id == "obj1"
+        assert r.rolling_rule == "front"
+        assert r.kwargs == {"session_id": "sess", "rolling_rule": "front"}
+
+        items = await client.strategies.list()
+        assert [o.object_id for o in items] == ["obj1"]
+
+        r = await client.strategies.get("obj2", session_id="sess")
+        assert r.object_id == "obj2"
+        assert r.query == {"sessionId": "sess"}
+
+        r = await client.strategies.delete("obj3")
+        assert r.deleted == "obj3"
+
+    _run(test)
+
+
+def test_async_shares_transport():
+    async def test(client, polls):
+        child = client.strategies.futures.rolling
+        assert child._url.endswith("/strategies/futures/rolling")
+        assert child._transport is client._transport
+        assert client.with_path("/a/b/")._url == f"{client._base_url}/a/b"
+        assert client.strategies.futures.rolling is child
+
+        strategies = client.strategies
+        assert client.strategies is strategies
+        client.wait_timeout = 10
+        assert client.strategies is not strategies
+        assert client.strategies.wait_timeout == 10
+
+        assert not hasattr(client, "__array_interface__")
+        copied = copy.copy(client)
+        assert copied._url == client._url
+
+    _run(test)
+
+
+def test_async_wait_for_object_status(monkeypatch):
+    async def no_sleep(_):
+        pass
+
+    monkeypatch.setattr("asyncio.sleep", no_sleep)
+
+    async def test(client, polls):
+        r = await client.wait_for_object_status("sess", "obj1")
+        assert r.status == "SUCCEEDED"
+        assert polls["count"] == 2
+
+    _run(test)
+
+
+def test_async_response_wait(monkeypatch):
+    async def no_sleep(_):
+        pass
+
+    monkeypatch.setattr("asyncio.sleep", no_sleep)
+
+    async def test(client, polls):
+        r = await client.strategies.create(session_id="sess")
+        assert (await r.latest_object_response()).status == "RUNNING"
+        final = await r.wait_for_object_status()
+        assert final.status == "SUCCEEDED"
+        assert polls["count"] == 2
+        assert await r.wait_for_object_status(property_name="object_id") is r
+
+    _run(test)
+
+
+def test_async_error_status():
+    async def test(client, polls):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.missing.get()
+
+    _run(test)
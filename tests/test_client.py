@@ -1,9 +1,19 @@
+import gzip
+import http.server
+import json
+import threading
 from unittest.mock import Mock
 
+import numpy as np
+import pandas as pd
 import pytest
+import requests
 
 from sigtech.api.client.client import Client
+from sigtech.api.client.polling import PollingPolicy
 from sigtech.api.client.response import Response
+from sigtech.api.client.transport import TransportSettings
+from sigtech.api.client.utils import dict_to_series
 from sigtech.api.version import __version__
 
 
@@ -67,3 +77,205 @@ def test_client_version_header():
         c._session.headers["Sig-Version"]  # pylint: disable=protected-access
         == __version__
     )
+
+
+def test_wait_for_object_status_returns_without_sleep(monkeypatch):
+    sleep_mock = Mock()
+    monkeypatch.setattr("time.sleep", sleep_mock)
+    c = Client("apikey", "http://test.url")
+    query_mock = Mock(return_value=Response({"status": "SUCCEEDED"}))
+    monkeypatch.setattr(c, "query_object", query_mock)
+    r = c.wait_for_object_status("sessid", "objid")
+    assert r.status == "SUCCEEDED"
+    query_mock.assert_called_once_with("sessid", "objid")
+    sleep_mock.assert_not_called()
+
+
+def test_wait_for_object_status_polling_policy(monkeypatch):
+    sleep_mock = Mock()
+    monkeypatch.setattr("time.sleep", sleep_mock)
+    policy = PollingPolicy(initial_delay=0.1, max_delay=0.3, jitter=0)
+    c = Client("apikey", "http://test.url", polling_policy=policy)
+    assert c.strategies.polling_policy is policy
+    responses = [Response({"status": "RUNNING"})] * 3 + [
+        Response({"status": "RUNNING", "name": "A"})
+    ]
+    monkeypatch.setattr(c, "query_object", Mock(side_effect=responses))
+    r = c.wait_for_object_status("sessid", "objid", property_name="name")
+    assert r.name == "A"
+    assert [o.args[0] for o in sleep_mock.call_args_list] == pytest.approx(
+        [0.1, 0.2, 0.3]
+    )
+
+
+def test_wait_for_object_status_per_call_policy(monkeypatch):
+    monkeypatch.setattr("time.sleep", Mock())
+    c = Client("apikey", "http://test.url")
+    monkeypatch.setattr(
+        c, "query_object", Mock(return_value=Response({"status": "RUNNING"}))
+    )
+    with pytest.raises(TimeoutError):
+        c.wait_for_object_status(
+            "sessid", "objid", polling_policy=PollingPolicy(deadline=1e-9)
+        )
+
+
+def test_polling_policy_delay():
+    policy = PollingPolicy(initial_delay=1, max_delay=5, backoff_factor=3, jitter=0.1)
+    for attempt, expected in enumerate([1, 3, 5, 5]):
+        assert 0.9 * expected <= policy.delay(attempt) <= 1.1 * expected
+    with pytest.raises(ValueError):
+        PollingPolicy(initial_delay=2, max_delay=1)
+
+
+def test_get_arrow(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(
+        {
+            "$timestamp": pa.array([0, 86_400_000_000], type=pa.timestamp("us")),
+            "$history": [1.0, None],
+        }
+    ).replace_schema_metadata({"sigtech.json": '{"nextPageId": "p2"}'})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    get_mock = Mock()
+    get_mock.return_value.status_code = 200
+    get_mock.return_value.headers = {
+        "Content-Type": "application/vnd.apache.arrow.stream"
+    }
+    get_mock.return_value.content = sink.getvalue().to_pybytes()
+    monkeypatch.setattr("requests.Session.get", get_mock)
+    r = Client("apikey", "http://test.url").get("id")
+    assert "arrow" in get_mock.call_args.kwargs["headers"]["Accept"]
+    assert r.next_page_id == "p2"
+    ts = dict_to_series(r.history)
+    assert ts.index.tolist() == list(pd.date_range("1970-01-01", periods=2))
+    assert ts.iloc[0] == 1.0 and np.isnan(ts.iloc[1])
+
+    get_mock.return_value.json.return_value = {"key": "value"}
+    Client("apikey", "http://test.url", columnar=False).get("id")
+    assert "headers" not in get_mock.call_args.kwargs
+
+
+def test_transport_settings():
+    transport = TransportSettings(pool_maxsize=4, read_timeout=5.0)
+    c = Client("apikey", "http://test.url", transport=transport)
+    adapter = c._session.get_adapter("https://test.url")
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == transport.max_retries
+    assert "POST" not in adapter.max_retries.allowed_methods
+    child = c.strategies.with_path("instruments")
+    assert child.transport is transport
+    assert child._session is c._session
+    with pytest.raises(ValueError):
+        TransportSettings(read_timeout=0)
+
+
+def test_transport_retries():
+    statuses = [503, 429, 200]
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = statuses.pop(0)
+            body = json.dumps({"key": status}).encode()
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        transport = TransportSettings(backoff_factor=0, backoff_jitter=0)
+        assert Client("apikey", url, transport=transport).get().key == 200
+        assert statuses == []
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_child_clients_cached():
+    c = Client("apikey", "http://test.url")
+    rolling = c.strategies.futures.rolling
+    assert rolling.url == "http://test.url/strategies/futures/rolling"
+    assert c.strategies.futures.rolling is rolling
+    assert c.with_path("/sessions/") is c.with_path("sessions")
+    assert rolling._session is c._session
+
+    policy = PollingPolicy(initial_delay=1)
+    c.polling_policy = policy
+    assert c.strategies.futures.rolling is not rolling
+    assert c.strategies.futures.rolling.polling_policy is policy
+
+
+def test_query_object_url(monkeypatch):
+    get_mock = Mock()
+    get_mock.return_value.status_code = 200
+    get_mock.return_value.json.return_value = {"status": "SUCCEEDED"}
+    monkeypatch.setattr("requests.Session.get", get_mock)
+    c = Client("apikey", "http://test.url").strategies
+    assert c.query_object("sess", "obj").status == "SUCCEEDED"
+    assert get_mock.call_args.args[0] == "http://test.url/sessions/sess/objects/obj"
+
+
+def test_create_compressed(monkeypatch):
+    post_mock = Mock()
+    post_mock.return_value.status_code = 200
+    post_mock.return_value.json.return_value = {"key": "value"}
+    monkeypatch.setattr("requests.Session.post", post_mock)
+    c = Client("apikey", "http://test.url", compress_requests=100)
+
+    c.create(key="value")
+    assert "Content-Encoding" not in post_mock.call_args.kwargs["headers"]
+
+    c.create(values=list(range(100)))
+    kwargs = post_mock.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == {"values": list(range(100))}
+
+    rejected = Mock(status_code=415)
+    accepted = Mock(status_code=200)
+    accepted.json.return_value = {"key": "value"}
+    post_mock.side_effect = [rejected, accepted, accepted]
+    c.create(values=list(range(100)))
+    c.create(values=list(range(100)))
+    assert post_mock.call_count == 5
+    assert "Content-Encoding" not in post_mock.call_args.kwargs["headers"]
+
+
+def test_create_compressed_bad_request(monkeypatch):
+    post_mock = Mock(return_value=Mock(status_code=400, text="invalid weights"))
+    post_mock.return_value.raise_for_status.side_effect = requests.HTTPError()
+    monkeypatch.setattr("requests.Session.post", post_mock)
+    c = Client("apikey", "http://test.url", compress_requests=100)
+
+    # Invalid inputs neither disable compression nor repeat the request.
+    with pytest.raises(requests.HTTPError):
+        c.create(values=list(range(100)))
+    assert post_mock.call_count == 1
+
+    rejected = Mock(status_code=400, text="Unsupported Content-Encoding: gzip")
+    accepted = Mock(status_code=200)
+    accepted.json.return_value = {"key": "value"}
+    post_mock.side_effect = [rejected, accepted]
+    c.create(values=list(range(100)))
+    assert post_mock.call_count == 3
+    assert "Content-Encoding" not in post_mock.call_args.kwargs["headers"]
+
+
+def test_create_nan(monkeypatch):
+    post_mock = Mock()
+    monkeypatch.setattr("requests.Session.post", post_mock)
+    c = Client("apikey", "http://test.url")
+    with pytest.raises(requests.exceptions.InvalidJSONError):
+        c.create(values=[1.0, float("nan")])
+    post_mock.assert_not_called()
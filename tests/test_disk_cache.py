@@ -0,0 +1,58 @@
+import os
+import time
+
+from sigtech.api.client.response import Response
+from sigtech.api.framework.disk_cache import DiskCache, content_hash
+from sigtech.api.framework.environment import obj
+
+
+def test_content_hash():
+    assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    assert cache.get("k") is None
+    cache.put("k", {"currency": "USD"})
+    assert cache.get("k") == {"currency": "USD"}
+    assert DiskCache(str(tmp_path)).get("k") == {"currency": "USD"}
+    cache.delete("k")
+    assert cache.get("k") is None
+    assert [p for p in os.listdir(tmp_path) if p.endswith(".tmp")] == []
+
+
+def test_disk_cache_ttl(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path), ttl=10)
+    cache.put("k", 1)
+    assert cache.get("k") == 1
+    now = time.time()
+    monkeypatch.setattr("time.time", lambda: now + 11)
+    assert cache.get("k") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_disk_cache_max_bytes(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes=150)
+    for i in range(3):
+        cache.put(f"k{i}", "x" * 40)
+        os.utime(cache._path(f"k{i}"), (i, i))
+    cache.put("k3", "x" * 40)
+    assert cache.get("k0") is None
+    assert cache.get("k3") == "x" * 40
+    assert sum(os.path.getsize(tmp_path / p) for p in os.listdir(tmp_path)) <= 150
+
+
+def test_reference_data_cache(mock_env, tmp_path):
+    mock_env.reference_data_cache = DiskCache(str(tmp_path))
+    mock_env.client.data.reference.get.return_value = Response(
+        {"reference": {"currency": "USD"}}
+    )
+    assert obj.get("A INDEX").currency == "USD"
+    assert mock_env.client.data.reference.get.call_count == 1
+
+    # A new object with the same inputs, e.g. in a new process
+    mock_env.object_register.clear()
+    mock_env.objects_by_id.clear()
+    assert obj.get("A INDEX").currency == "USD"
+    assert mock_env.client.data.reference.get.call_count == 1
@@ -0,0 +1,142 @@
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from sigtech.api.client.poller import StatusPoller
+from sigtech.api.client.polling import PollingPolicy
+from sigtech.api.client.response import Response
+from sigtech.api.framework import environment
+from sigtech.api.framework.environment import Environment, obj
+from sigtech.api.framework.framework_api_object import (
+    prefetch_reference_data,
+    wait_for_objects,
+)
+
+
+def test_get_many(mock_env):
+    existing = obj.get("C INDEX")
+    assert mock_env.client.instruments.create.call_count == 1
+
+    result = obj.get_many(["A INDEX", "B INDEX", "A INDEX", "C INDEX"], max_workers=2)
+    assert [o.api_object_id for o in result] == [
+        "id-A INDEX",
+        "id-B INDEX",
+        "id-A INDEX",
+        "id-C INDEX",
+    ]
+    assert result[0] is result[2]
+    assert result[3] is existing
+    assert mock_env.client.instruments.create.call_count == 3
+    mock_env.client.sessions.create.assert_called_once()
+
+
+def test_get_many_waits_once(mock_env):
+    create = mock_env.client.instruments.create.side_effect
+
+    def create_running(**kwargs):
+        response = create(**kwargs)
+        return Response({**response.d, "status": "RUNNING"}, kwargs=response.kwargs)
+
+    mock_env.client.instruments.create.side_effect = create_running
+    mock_env.client.query_object.side_effect = lambda session_id, object_id: (
+        Response({"objectId": object_id, "status": "SUCCEEDED"})
+    )
+    mock_env.client.wait_timeout = 5
+    mock_env._poller = StatusPoller(
+        mock_env.client, polling_policy=PollingPolicy(initial_delay=0.001)
+    )
+    try:
+        objects = obj.get_many(["A INDEX", "B INDEX"])
+        assert mock_env.client.query_object.call_count == 2
+        wait_for_objects(objects)
+        assert mock_env.client.query_object.call_count == 2
+        assert [o.api_status for o in objects] == ["SUCCEEDED"] * 2
+    finally:
+        mock_env._poller.shutdown()
+
+
+def test_get_many_fixtures(mock_env):
+    (group,) = obj.get_many(["SPX INDEX OTC OPTION GROUP"])
+    assert group.name == "SPX INDEX OTC OPTION GROUP"
+    mock_env.client.instruments.create.assert_not_called()
+
+
+def test_get_uses_indexes(mock_env):
+    a = obj.get("A INDEX")
+    assert obj.get("id-A INDEX") is a
+    assert mock_env.objects_by_id["id-A INDEX"] is a
+    assert mock_env.object_register["A INDEX"] is a
+
+    unnamed = Mock()
+    unnamed.api_object_id = "id-unnamed"
+    unnamed.creation_response = Response({"objectId": "id-unnamed"})
+    mock_env.register(unnamed)
+    assert obj.get("id-unnamed") is unnamed
+    assert obj.get("A INDEX") is a
+    assert mock_env.client.instruments.create.call_count == 1
+    mock_env.client.query_object.assert_not_called()
+
+
+def test_registry_holds_instruments(mock_env, monkeypatch):
+    monkeypatch.setattr(Environment, "max_held_objects", 2)
+    obj.get("A INDEX")
+    gc.collect()
+    assert obj.get("A INDEX").api_object_id == "id-A INDEX"
+    assert mock_env.client.instruments.create.call_count == 1
+
+    # Only the most recently resolved instruments are held.
+    obj.get_many(["B INDEX", "C INDEX"])
+    gc.collect()
+    assert "A INDEX" not in mock_env.object_register
+    assert "id-A INDEX" not in mock_env.objects_by_id
+    assert len(mock_env.all_objects) == 2
+
+
+def test_context_environment(mock_env):
+    other = Environment(Mock())
+    assert environment.env() is mock_env
+    with other as e:
+        assert e is other
+        assert environment.env() is other
+        with mock_env:
+            assert environment.env() is mock_env
+        assert environment.env() is other
+    assert environment.env() is mock_env
+
+
+def test_context_environment_threads(mock_env):
+    envs = [Environment(Mock()) for _ in range(4)]
+
+    def run(e):
+        with e:
+            time.sleep(0.01)
+            return environment.env()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(run, envs)) == envs
+    assert environment.env() is mock_env
+
+
+def test_session_created_once(mock_env):
+    def create_session(settings):
+        time.sleep(0.01)
+        return Response({"sessionId": "sess"})
+
+    mock_env.client.sessions.create.side_effect = create_session
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ids = list(executor.map(lambda _: mock_env.session_id, range(8)))
+    assert ids == ["sess"] * 8
+    mock_env.client.sessions.create.assert_called_once_with(settings={})
+
+
+def test_prefetch_reference_data(mock_env):
+    def reference(session_id, object_id):
+        return Response({"reference": {"currency": object_id[-3:]}})
+
+    mock_env.client.data.reference.get.side_effect = reference
+    objects = obj.get_many(["A USD", "B EUR", "C JPY"])
+    prefetch_reference_data(objects + objects[:1], max_workers=2)
+    assert mock_env.client.data.reference.get.call_count == 3
+    assert [o.currency for o in objects] == ["USD", "EUR", "JPY"]
+    assert mock_env.client.data.reference.get.call_count == 3
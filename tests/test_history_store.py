@@ -0,0 +1,110 @@
+import datetime as dtm
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sigtech.api.client.response import Response
+from sigtech.api.framework.history_store import HistoryStore
+from sigtech.api.framework.indices.tradable_index import TradableTSIndex
+
+
+def test_history_store(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    assert store.get("k") is None
+    ts = pd.Series(
+        [1.0, np.nan, 3.0],
+        index=pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03"]),
+        name="A STRATEGY",
+    )
+    store.put("k", ts)
+    pd.testing.assert_series_equal(store.get("k"), ts, check_index_type=False)
+    store.put("k", ts.rename(None))
+    assert store.get("k").name is None
+    store.invalidate("k")
+    assert store.get("k") is None
+
+
+@pytest.fixture
+def custom_index(mock_env):
+    custom = mock_env.client.instruments.custom
+    custom.url = "http://test.url/instruments/custom"
+    custom.create.side_effect = lambda **kwargs: Response(
+        {"objectId": "ts1", "status": "SUCCEEDED", "name": "TS INDEX"},
+        client=custom,
+        kwargs=kwargs,
+    )
+    mock_env.client.performance.history.get.return_value = Response(
+        {
+            "history": {
+                "$timestamp": ["2020-01-02T00:00:00", "2020-01-01T00:00:00"],
+                "$history": [2.0, 1.0],
+            }
+        }
+    )
+
+    def create():
+        return TradableTSIndex(
+            currency="USD",
+            timeseries=pd.Series(
+                [1.0, 2.0], index=pd.to_datetime(["2020-01-01", "2020-01-02"])
+            ),
+            start_date=dtm.datetime(2020, 1, 1),
+        )
+
+    return create
+
+
+def test_history_uses_store(mock_env, custom_index, tmp_path):
+    mock_env.history_store = HistoryStore(str(tmp_path))
+    history_get = mock_env.client.performance.history.get
+
+    ts = custom_index().history()
+    assert ts.tolist() == [1.0, 2.0]
+    assert ts.name == "TS INDEX"
+    assert ts.index.name == "date"
+    assert history_get.call_count == 1
+
+    index = custom_index()
+    pd.testing.assert_series_equal(index.history(), ts, check_index_type=False)
+    assert history_get.call_count == 1
+
+    index.invalidate_history()
+    index.history()
+    assert history_get.call_count == 2
+
+
+def test_history_refresh(mock_env, custom_index, tmp_path):
+    mock_env.history_store = HistoryStore(str(tmp_path))
+    history_get = mock_env.client.performance.history.get
+    index = custom_index()
+    index.history()
+
+    history_get.return_value = Response(
+        {
+            "history": {
+                "$timestamp": [
+                    "2020-01-01T00:00:00",
+                    "2020-01-02T00:00:00",
+                    "2020-01-03T00:00:00",
+                ],
+                "$history": [1.0, 2.0, 3.0],
+            }
+        }
+    )
+    ts = index.history(refresh=True)
+    assert ts.tolist() == [1.0, 2.0, 3.0]
+    assert history_get.call_args.kwargs["start_date"] == "2020-01-01T00:00:00"
+    assert custom_index().history().tolist() == [1.0, 2.0, 3.0]
+
+    history_get.return_value = Response(
+        {
+            "history": {
+                "$timestamp": ["2020-01-03T00:00:00", "2020-01-04T00:00:00"],
+                "$history": [3.5, 4.0],
+            }
+        }
+    )
+    index.history(refresh=True)
+    assert history_get.call_count == 4
+    assert "start_date" not in history_get.call_args.kwargs
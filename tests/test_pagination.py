@@ -0,0 +1,47 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from sigtech.api.client.pagination import ColumnBuffer, iter_pages, read_columns
+from sigtech.api.client.response import Response
+
+
+def test_iter_pages():
+    pages = {
+        None: {"history": {"a": [1]}, "nextPageId": "p2"},
+        "p2": {"history": {"a": [2]}, "nextPageId": "p3"},
+        "p3": {"history": {"a": [3]}},
+    }
+    client = Mock()
+    client.get.side_effect = lambda page_id=None, **kwargs: Response(pages[page_id])
+
+    result = list(iter_pages(client, page_size=10, object_id="obj"))
+    assert [p.history for p in result] == [{"a": [1]}, {"a": [2]}, {"a": [3]}]
+    assert client.get.call_count == 3
+    client.get.assert_called_with(page_size=10, page_id="p3", object_id="obj")
+
+
+def test_read_columns():
+    columns = read_columns(
+        [
+            {"n": ["a", "b"], "x": [1, 2], "y": [1.0, 2.0]},
+            {"n": ["c"], "x": [None], "y": np.array([3.0])},
+        ],
+        capacity=1,
+    )
+    assert columns["n"].tolist() == ["a", "b", "c"]
+    assert columns["x"].dtype == np.float64
+    assert columns["x"][:2].tolist() == [1.0, 2.0] and np.isnan(columns["x"][2])
+    assert columns["y"].tolist() == [1.0, 2.0, 3.0]
+
+    with pytest.raises(ValueError):
+        read_columns([{"a": [1]}, {"b": [1]}])
+
+
+def test_column_buffer_growth():
+    buffer = ColumnBuffer()
+    for i in range(100):
+        buffer.extend(np.arange(i, i + 1))
+    assert buffer.to_numpy().tolist() == list(range(100))
+    assert len(ColumnBuffer().to_numpy()) == 0
@@ -0,0 +1,55 @@
+import gc
+
+import pandas as pd
+
+from sigtech.api.framework.payload_cache import CachedPayload, PayloadCache
+
+
+class _Owner:
+    _history = CachedPayload()
+
+    def __init__(self, cache):
+        self._payload_cache = cache
+        self._history = None
+
+
+def _series(n):
+    return pd.Series(range(n), dtype="float64")
+
+
+def test_lru_eviction():
+    cache = PayloadCache(max_bytes=2500)
+    a, b, c = _Owner(cache), _Owner(cache), _Owner(cache)
+    a._history = _series(100)
+    b._history = _series(100)
+    assert a._history is not None
+    c._history = _series(100)
+    # b was the least recently used payload
+    assert b._history is None
+    assert a._history is not None
+    assert c._history is not None
+    assert cache.nbytes <= 2500
+
+    cache.max_bytes = 1000
+    assert len(cache) == 1
+    assert c._history is not None
+
+
+def test_oversized_payload_not_cached():
+    cache = PayloadCache(max_bytes=100)
+    a = _Owner(cache)
+    a._history = _series(100)
+    assert a._history is None
+    assert cache.nbytes == 0
+
+
+def test_entries_dropped_with_owner():
+    cache = PayloadCache()
+    a = _Owner(cache)
+    a._history = {"currency": "USD"}
+    assert a._history == {"currency": "USD"}
+    assert len(cache) == 1
+    del a
+    gc.collect()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
@@ -0,0 +1,202 @@
+import datetime as dtm
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sigtech.api.client.response import Response
+from sigtech.api.framework.plot_wrapper import PlotWrapper
+
+ROWS = [
+    ("2020-01-01T00:00:00", "A STRATEGY", 0, None, "STRATEGY", 100.0, None),
+    ("2020-01-01T00:00:00", "B INDEX", 1, "2020-01-01T10:00:00", "POSITION", 1, 0.5),
+    ("2020-01-02T00:00:00", "A STRATEGY", 0, None, "STRATEGY", 101.0, None),
+    ("2020-01-02T00:00:00", "USD CASH", 1, None, "CASH", 2.5, 0.25),
+]
+
+
+def _page(rows, next_page_id=None):
+    history = {
+        "$timestamp": [r[0] for r in rows],
+        "name": [r[1] for r in rows],
+        "level": [r[2] for r in rows],
+        "executionTime": [r[3] for r in rows],
+        "type": [r[4] for r in rows],
+        "quantity": [r[5] for r in rows],
+        "tradeQuantity": [r[5] for r in rows],
+        "weight": [r[6] for r in rows],
+        "exposureWeight": [r[6] for r in rows],
+        "valuation": [r[5] for r in rows],
+        "value": [r[5] for r in rows],
+        "valueLocal": [r[5] for r in rows],
+    }
+    d = {"history": history}
+    if next_page_id is not None:
+        d["nextPageId"] = next_page_id
+    return Response(d)
+
+
+def _strategy(page_size, rows=ROWS):
+    starts = range(0, len(rows), page_size)
+    pages = [rows[start:][:page_size] for start in starts]
+    client = Mock()
+    client.performance.history.get.side_effect = lambda page_id=0, **kwargs: _page(
+        pages[page_id], page_id + 1 if page_id + 1 < len(pages) else None
+    )
+    strategy = Mock()
+    strategy.environment.client = client
+    strategy.environment.session_id = "sess"
+    return strategy
+
+
+def test_portfolio_table():
+    expected = None
+    for page_size in (1, 3, 4):
+        strategy = _strategy(page_size)
+        df = PlotWrapper(strategy).portfolio_table(as_df=True, page_size=page_size)
+        get = strategy.environment.client.performance.history.get
+        assert get.call_count == -(-len(ROWS) // page_size)
+        assert get.call_args.kwargs["page_size"] == page_size
+        if expected is None:
+            expected = df
+        assert df.equals(expected)
+
+    assert expected.index.tolist() == [
+        ("2020/01/01, 00:00:00", "A STRATEGY", 0),
+        ("2020/01/01, 00:00:00", "B INDEX", 1),
+        ("2020/01/02, 00:00:00", "A STRATEGY", 0),
+        ("2020/01/02, 00:00:00", "USD CASH", 1),
+    ]
+    assert expected["Execution Time"].tolist() == [
+        "-",
+        "2020/01/01, 10:00:00",
+        "-",
+        "-",
+    ]
+    assert expected["Weight"].tolist() == ["-", "0.5%", "-", "0.25%"]
+    assert expected["Units"].tolist() == ["100.0", "1.0", "101.0", "2.5"]
+    assert expected["Position Type"].tolist() == [
+        "Strategy",
+        "Position",
+        "Strategy",
+        "Cash",
+    ]
+
+
+def test_portfolio_table_missing_type():
+    rows = ROWS + [("2020-01-02T00:00:00", "C INDEX", 1, None, None, 0.0, 0.0)]
+    df = PlotWrapper(_strategy(2, rows)).portfolio_table(as_df=True)
+    assert df["Position Type"].tolist() == [
+        "Strategy",
+        "Position",
+        "Strategy",
+        "Cash",
+        "-",
+    ]
+
+
+def test_portfolio_table_typed():
+    df = PlotWrapper(_strategy(2)).portfolio_table(as_df=True, typed=True)
+    assert df.index.names == ["Date", "Name", "Level"]
+    assert pd.api.types.is_datetime64_any_dtype(df.index.get_level_values("Date"))
+    assert pd.api.types.is_datetime64_any_dtype(df["Execution Time"])
+    assert df["Weight"].dtype == np.float64
+    assert df["Position Type"].dtype == "category"
+    assert df["Units"].tolist() == [100.0, 1.0, 101.0, 2.5]
+
+
+def test_portfolio_table_window():
+    strategy = _strategy(3)
+    df = PlotWrapper(strategy).portfolio_table(
+        as_df=True,
+        typed=True,
+        start_dt=dtm.datetime(2020, 1, 1, 12),
+        tzinfo="Europe/London",
+    )
+    create = strategy.environment.client.analytics.portfolio.create
+    assert create.call_args.kwargs["start_date"] == "2020-01-01T12:00:00"
+    assert "end_date" not in create.call_args.kwargs
+    get = strategy.environment.client.performance.history.get
+    assert get.call_args.kwargs["start_date"] == "2020-01-01T12:00:00"
+    assert df.index.get_level_values("Name").tolist() == ["A STRATEGY", "USD CASH"]
+    assert str(df.index.get_level_values("Date").tz) == "Europe/London"
+
+    ny = dtm.timezone(-dtm.timedelta(hours=5))
+    df = PlotWrapper(_strategy(3)).portfolio_table(
+        as_df=True,
+        start_dt=dtm.datetime(2019, 12, 31, 19, tzinfo=ny),
+        end_dt=dtm.datetime(2020, 1, 1, 9),
+        tzinfo="Asia/Tokyo",
+    )
+    assert df.index.tolist() == [
+        ("2020/01/01, 09:00:00", "A STRATEGY", 0),
+        ("2020/01/01, 09:00:00", "B INDEX", 1),
+    ]
+    assert df["Execution Time"].tolist() == ["-", "2020/01/01, 19:00:00"]
+
+    with pytest.raises(ValueError):
+        PlotWrapper(_strategy(3)).portfolio_table(
+            as_df=True,
+            start_dt=dtm.datetime(2021, 1, 1),
+            end_dt=dtm.datetime(2020, 1, 1),
+        )
+
+
+def test_portfolio_table_window_offsets():
+    # Only some pages are filtered, all pages must have the same timestamps.
+    rows = [(r[0] + "+00:00",) + r[1:] for r in ROWS]
+    df = PlotWrapper(_strategy(3, rows)).portfolio_table(
+        as_df=True,
+        typed=True,
+        start_dt=dtm.datetime(2020, 1, 1, 12),
+        page_size=3,
+    )
+    dates = df.index.get_level_values("Date")
+    assert list(dates) == [pd.Timestamp("2020-01-02", tz="UTC")] * 2
+    assert df.index.get_level_values("Name").tolist() == ["A STRATEGY", "USD CASH"]
+
+
+def test_portfolio_projection():
+    strategy = _strategy(3)
+    df = PlotWrapper(strategy)._portfolio_df(
+        columns=["value"], max_level=0, page_size=3
+    )
+    create = strategy.environment.client.analytics.portfolio.create
+    assert create.call_args.kwargs["columns"] == [
+        "$timestamp",
+        "level",
+        "name",
+        "value",
+    ]
+    assert create.call_args.kwargs["max_level"] == 0
+    assert list(df.columns) == ["value"]
+    assert df["value"].tolist() == [100.0, 101.0]
+
+    # Rows are filtered on columns which are not kept.
+    df = PlotWrapper(_strategy(3))._portfolio_df(
+        columns=["weight"], types=["POSITION", "CASH"], page_size=3
+    )
+    assert list(df.columns) == ["weight"]
+    assert df["weight"].tolist() == [0.5, 0.25]
+
+    strategy = _strategy(3)
+    df = PlotWrapper(strategy).portfolio_table(as_df=True, types=["POSITION", "CASH"])
+    assert df["Position Type"].tolist() == ["Position", "Cash"]
+    create = strategy.environment.client.analytics.portfolio.create
+    assert create.call_args.kwargs["types"] == ["POSITION", "CASH"]
+    assert "columns" not in create.call_args.kwargs
+
+    # No projection is requested by default.
+    strategy = _strategy(3)
+    PlotWrapper(strategy).portfolio_table(as_df=True)
+    create = strategy.environment.client.analytics.portfolio.create
+    assert set(create.call_args.kwargs) == {
+        "session_id",
+        "strategy",
+        "points",
+        "flatten",
+    }
+
+    with pytest.raises(ValueError):
+        PlotWrapper(_strategy(3)).portfolio_table(as_df=True, types=["BOND"])
@@ -0,0 +1,89 @@
+from unittest.mock import Mock
+
+import pytest
+
+from sigtech.api.client.poller import StatusPoller
+from sigtech.api.client.polling import PollingPolicy
+from sigtech.api.client.response import Response
+from sigtech.api.client.utils import SigApiException
+
+
+def _client(statuses):
+    """Mock client returning the listed statuses, one per poll, per object."""
+    calls = {k: 0 for k in statuses}
+
+    def query_object(session_id, object_id):
+        n = calls[object_id]
+        calls[object_id] += 1
+        status = statuses[object_id][min(n, len(statuses[object_id]) - 1)]
+        return Response({"objectId": object_id, "status": status})
+
+    client = Mock()
+    client.query_object.side_effect = query_object
+    client.wait_timeout = 5
+    client.polling_policy = PollingPolicy(initial_delay=0.001, max_delay=0.01)
+    return client, calls
+
+
+def _creation_response(object_id, status="RUNNING"):
+    return Response(
+        {"objectId": object_id, "status": status}, kwargs={"session_id": "sess"}
+    )
+
+
+def test_wait_all():
+    client, calls = _client(
+        {
+            "a": ["RUNNING", "SUCCEEDED"],
+            "b": ["RUNNING", "RUNNING", "RUNNING", "SUCCEEDED"],
+            "c": ["SUCCEEDED"],
+        }
+    )
+    poller = StatusPoller(client, max_workers=2)
+    try:
+        results = poller.wait_all(
+            [
+                _creation_response("a"),
+                _creation_response("b"),
+                _creation_response("c"),
+                _creation_response("d", status="SUCCEEDED"),
+            ]
+        )
+    finally:
+        poller.shutdown()
+    assert [r.object_id for r in results] == ["a", "b", "c", "d"]
+    assert all(r.status == "SUCCEEDED" for r in results)
+    assert calls == {"a": 2, "b": 4, "c": 1}
+
+
+def test_submit_shares_future():
+    client, calls = _client({"a": ["RUNNING", "SUCCEEDED"]})
+    poller = StatusPoller(client)
+    try:
+        f1 = poller.submit("sess", "a")
+        f2 = poller.submit("sess", "a")
+        assert f1 is f2
+        assert f1.result(timeout=5).status == "SUCCEEDED"
+    finally:
+        poller.shutdown()
+    assert calls == {"a": 2}
+
+
+def test_wait_all_failed():
+    client, _ = _client({"a": ["SUCCEEDED"], "b": ["RUNNING", "FAILED"]})
+    poller = StatusPoller(client)
+    try:
+        with pytest.raises(SigApiException):
+            poller.wait_all([_creation_response("a"), _creation_response("b")])
+    finally:
+        poller.shutdown()
+
+
+def test_wait_all_timeout():
+    client, _ = _client({"a": ["RUNNING"]})
+    poller = StatusPoller(client)
+    try:
+        with pytest.raises(TimeoutError):
+            poller.wait_all([_creation_response("a")], timeout=0.05)
+    finally:
+        poller.shutdown()
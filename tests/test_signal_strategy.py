@@ -0,0 +1,187 @@
+import gc
+import json
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from sigtech.api.client.client import Client
+from sigtech.api.client.response import Response
+from sigtech.api.framework.environment import Environment
+from sigtech.api.framework.strategies.signal_strategy import (
+    SignalStrategy,
+    SignalValidationError,
+    delta_signal,
+    sparse_signal,
+    validate_signal,
+)
+
+
+@pytest.fixture
+def signal_create(mock_env):
+    create = mock_env.client.strategies.signal.create
+    create.side_effect = lambda **kwargs: Response(
+        {"objectId": "sig", "status": "SUCCEEDED"},
+        client=mock_env.client.strategies.signal,
+        kwargs=kwargs,
+    )
+    return create
+
+
+@pytest.fixture
+def signal_df():
+    return pd.DataFrame(
+        {"A INDEX": [1.0, np.nan, 0.5], "B INDEX": [np.nan, np.nan, 0.5]},
+        index=pd.date_range("2020-01-01", periods=3),
+    )
+
+
+def test_signal_encodings(signal_create, signal_df):
+    SignalStrategy(signal_df, signal_encoding="dense")
+    kwargs = signal_create.call_args.kwargs
+    assert "signal_encoding" not in kwargs
+    expected = {
+        "$timestamp": [
+            "2020-01-01T00:00:00",
+            "2020-01-02T00:00:00",
+            "2020-01-03T00:00:00",
+        ],
+        "id-A INDEX": [1.0, None, 0.5],
+        "id-B INDEX": [None, None, 0.5],
+    }
+    assert kwargs["signal"] == expected
+
+    SignalStrategy(signal_df, signal_encoding="columnar")
+    kwargs = signal_create.call_args.kwargs
+    assert kwargs["signal_encoding"] == "columnar"
+    assert kwargs["signal"] == {
+        "$timestamp": expected["$timestamp"],
+        "columns": {
+            "id-A INDEX": {"rows": [0, 2], "values": [1.0, 0.5]},
+            "id-B INDEX": {"rows": [2], "values": [0.5]},
+        },
+    }
+
+    with pytest.raises(ValueError):
+        SignalStrategy(signal_df, signal_encoding="csv")
+
+
+def test_signal_encoding_fallback(signal_create, signal_df):
+    create = signal_create.side_effect
+
+    def reject_columnar(**kwargs):
+        if "signal_encoding" in kwargs:
+            raise requests.HTTPError(response=Mock(status_code=400))
+        return create(**kwargs)
+
+    signal_create.side_effect = reject_columnar
+    SignalStrategy(signal_df)
+    assert signal_create.call_count == 1
+    SignalStrategy(signal_df, signal_encoding="columnar")
+    assert signal_create.call_count == 3
+    kwargs = signal_create.call_args.kwargs
+    assert "signal_encoding" not in kwargs
+    assert kwargs["signal"]["id-B INDEX"][2] == 0.5
+
+
+def test_sparse_and_delta_signals():
+    index = pd.date_range("2020-01-01", periods=4)
+    values = np.array([[0.5, 0.0], [0.5, 0.0], [np.nan, 1.0], [np.nan, 1.0]])
+    columns = ["a", "b"]
+
+    sparse = sparse_signal(index, columns, values)
+    assert sparse["instruments"] == columns
+    assert sparse["rows"] == [0, 1, 2, 3]
+    assert sparse["instrumentIndex"] == [0, 0, 1, 1]
+    assert sparse["values"] == [0.5, 0.5, 1.0, 1.0]
+
+    delta = delta_signal(index, columns, values)
+    assert delta["$timestamp"] == ["2020-01-01T00:00:00", "2020-01-03T00:00:00"]
+    assert delta["a"] == [0.5, None]
+    assert delta["b"] == [0.0, 1.0]
+    assert delta_signal(index[:0], columns, values[:0])["$timestamp"] == []
+
+
+def test_validate_signal(mock_env, signal_df):
+    assert validate_signal(signal_df) == []
+
+    bad = pd.DataFrame(
+        [[1.0, np.nan, np.inf], [1.0, np.nan, 20.0], [1.0, np.nan, 0.0]],
+        index=pd.to_datetime(["2020-01-02", "2020-01-01", "2020-01-01"]),
+        columns=["A INDEX", "B INDEX", ""],
+    )
+    with pytest.raises(SignalValidationError) as e:
+        SignalStrategy(bad, max_gross_weight=10)
+    assert e.value.problems == [
+        "duplicate timestamps: 2020-01-01 00:00:00",
+        "invalid instrument identifiers: ''",
+        "instruments without any weight: 'B INDEX'",
+        "infinite weights for: ''",
+        "sum of absolute weights above 10 on 1 timestamps: 2020-01-01 00:00:00",
+    ]
+    mock_env.client.instruments.create.assert_not_called()
+
+    problems = validate_signal(signal_df.reset_index(drop=True), raise_errors=False)
+    assert problems == ["index must be a DatetimeIndex, not RangeIndex"]
+
+    assert SignalStrategy.validate(signal_df) == []
+    assert SignalStrategy.validate(bad.iloc[:, :1]) == [
+        "duplicate timestamps: 2020-01-01 00:00:00"
+    ]
+    mock_env.client.instruments.create.assert_not_called()
+    mock_env.client.strategies.signal.create.assert_not_called()
+
+
+def test_signal_constituents_reused(mock_env, signal_create, signal_df):
+    strategy = SignalStrategy(signal_df)
+    gc.collect()
+    assert [x.api_object_id for x in strategy._constituents] == [
+        "id-A INDEX",
+        "id-B INDEX",
+    ]
+    del strategy
+    gc.collect()
+    # Only the collected strategy is created again, not its constituents.
+    SignalStrategy(signal_df)
+    assert mock_env.client.instruments.create.call_count == 2
+    assert signal_create.call_count == 2
+
+
+def test_validated_signal_is_uploaded(monkeypatch, signal_df):
+    posts = []
+
+    def post(session, url, data=None, **kwargs):
+        body = json.loads(data)
+        posts.append((url, body))
+        if url.endswith("/sessions"):
+            d = {"sessionId": "sess"}
+        elif url.endswith("/instruments"):
+            identifier = body["identifier"]
+            d = {"objectId": f"id-{identifier}", "status": "SUCCEEDED", "type": "Index"}
+        else:
+            d = {"objectId": "sig", "status": "SUCCEEDED"}
+        return Mock(status_code=200, json=Mock(return_value=d))
+
+    monkeypatch.setattr("requests.Session.post", post)
+    # A signal with missing weights is valid, and can be sent as is.
+    assert SignalStrategy.validate(signal_df) == []
+    with Environment(Client("apikey", "http://test.url")):
+        SignalStrategy(signal_df)
+    url, body = posts[-1]
+    assert url == "http://test.url/strategies/signal"
+    assert body["signal"]["id-B INDEX"] == [None, None, 0.5]
+
+
+def test_signal_memo(signal_create, signal_df):
+    a = SignalStrategy(signal_df)
+    b = SignalStrategy(signal_df.copy())
+    assert b.creation_response is a.creation_response
+    assert signal_create.call_count == 1
+    assert "signal_digest" not in signal_create.call_args.kwargs
+
+    changed = signal_df.copy()
+    changed.iloc[0, 0] = 2.0
+    SignalStrategy(changed)
+    assert signal_create.call_count == 2
@@ -0,0 +1,59 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from sigtech.api.client.client import Client
+from sigtech.api.client.single_flight import SingleFlight
+
+
+def test_single_flight_coalesces():
+    calls = []
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    sf = SingleFlight()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(sf.do, "k", fn) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [f.result() for f in futures]
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+    # Completed calls are not shared without a ttl
+    assert sf.do("k", object) is not results[0]
+
+
+def test_single_flight_errors_and_ttl():
+    sf = SingleFlight()
+    with pytest.raises(KeyError):
+        sf.do("k", Mock(side_effect=KeyError("k")))
+
+    fn = Mock(side_effect=lambda: object())
+    first = sf.do("k", fn, ttl=60)
+    assert sf.do("k", fn, ttl=60) is first
+    assert sf.do("k", fn) is not first
+    sf.clear()
+    assert sf.do("k", fn, ttl=60) is not first
+    assert fn.call_count == 3
+
+
+def test_query_object_status_ttl(monkeypatch):
+    get_mock = Mock()
+    get_mock.return_value.status_code = 200
+    get_mock.return_value.json.return_value = {"status": "RUNNING"}
+    monkeypatch.setattr("requests.Session.get", get_mock)
+
+    c = Client("apikey", "http://test.url", status_ttl=60)
+    c.query_object("sess", "obj")
+    c.strategies.query_object("sess", "obj")
+    assert get_mock.call_count == 1
+    c.query_object("sess", "other")
+    assert get_mock.call_count == 2
@@ -0,0 +1,140 @@
+import gc
+from unittest.mock import Mock
+
+import pytest
+
+import sigtech.api as sig
+from sigtech.api.client.response import Response
+from sigtech.api.framework.disk_cache import DiskCache
+from sigtech.api.framework.environment import Environment
+from sigtech.api.framework.strategies.strategy import Strategy
+
+
+class DummyStrategy(Strategy):
+    def _get_strategy_obj(self, session_id, **inputs):
+        return self.environment_client().strategies.dummy.create(
+            session_id=session_id, **inputs
+        )
+
+    @staticmethod
+    def environment_client():
+        from sigtech.api.framework.environment import env
+
+        return env().client
+
+
+@pytest.fixture
+def dummy_create(mock_env):
+    create = mock_env.client.strategies.dummy.create
+    create.side_effect = lambda **kwargs: Response(
+        {"objectId": f"strat-{create.call_count}", "status": "SUCCEEDED"},
+        client=mock_env.client.strategies.dummy,
+        kwargs=kwargs,
+    )
+    return create
+
+
+def test_strategy_memo(mock_env, dummy_create):
+    a = DummyStrategy(currency="USD", weights=[1, 2], ticker=None)
+    b = DummyStrategy(weights=[1, 2], currency="USD")
+    assert b.creation_response is a.creation_response
+    assert dummy_create.call_count == 1
+
+    DummyStrategy(currency="EUR", weights=[1, 2])
+    assert dummy_create.call_count == 2
+
+    # Only object IDs are memoized, collected strategies are created again.
+    assert set(mock_env.strategy_memo.values()) == {"strat-1", "strat-2"}
+    del a, b
+    gc.collect()
+    DummyStrategy(currency="USD", weights=[1, 2])
+    assert dummy_create.call_count == 3
+
+    mock_env.memoize_strategies = False
+    DummyStrategy(currency="USD", weights=[1, 2])
+    assert dummy_create.call_count == 4
+
+
+def test_strategy_memo_failed(mock_env, dummy_create):
+    create = dummy_create.side_effect
+    dummy_create.side_effect = lambda **kwargs: Response(
+        {**create(**kwargs).d, "status": "PENDING"},
+        client=mock_env.client,
+        kwargs=kwargs,
+    )
+    mock_env.client.query_object.return_value = Response({"status": "RUNNING"})
+    a = DummyStrategy(currency="USD")
+    assert DummyStrategy(currency="USD").api_object_id == a.api_object_id
+    assert dummy_create.call_count == 1
+
+    # Failed strategies are created again.
+    mock_env.client.query_object.return_value = Response({"status": "FAILED"})
+    b = DummyStrategy(currency="USD")
+    assert b.api_object_id != a.api_object_id
+    assert dummy_create.call_count == 2
+
+
+def test_strategy_memo_disk(mock_env, dummy_create, tmp_path):
+    mock_env.client.url = "http://test.url"
+    mock_env.client.strategies.dummy.url = "http://test.url/strategies/dummy"
+    mock_env.strategy_cache = DiskCache(str(tmp_path))
+    a = DummyStrategy(currency="USD")
+
+    resumed = Environment(mock_env.client)
+    resumed.resume_session(mock_env.session_id)
+    resumed.strategy_cache = DiskCache(str(tmp_path))
+    resumed.client.with_path.return_value = resumed.client
+    resumed.client.query_object = Mock(
+        return_value=Response({"objectId": a.api_object_id, "status": "SUCCEEDED"})
+    )
+    with resumed:
+        b = DummyStrategy(currency="USD")
+    resumed.client.with_path.assert_called_with("strategies/dummy")
+    assert b.api_object_id == a.api_object_id
+    assert b.creation_response.kwargs == a.creation_response.kwargs
+    assert dummy_create.call_count == 1
+
+    failed = Environment(mock_env.client)
+    failed.resume_session(mock_env.session_id)
+    failed.strategy_cache = DiskCache(str(tmp_path))
+    failed.client.query_object.return_value = Response({"status": "FAILED"})
+    with failed:
+        DummyStrategy(currency="USD")
+    assert dummy_create.call_count == 2
+
+
+def test_strategy_submit_gather(mock_env, dummy_create):
+    mock_env.memoize_strategies = False
+    futures = [DummyStrategy.submit(currency="USD", weight=w) for w in range(5)]
+    done = DummyStrategy(currency="EUR")
+    strategies = sig.gather(futures + [done])
+    assert all(isinstance(s, DummyStrategy) for s in strategies)
+    assert [s.creation_response.kwargs.get("weight") for s in strategies] == [
+        *range(5),
+        None,
+    ]
+    assert strategies[-1] is done
+    assert mock_env.client.sessions.create.call_count == 1
+    assert dummy_create.call_count == 6
+
+
+def test_wait_for_objects_environments(mock_env, dummy_create):
+    other = Environment(mock_env.client)
+    other.resume_session("other")
+    a = DummyStrategy(currency="USD")
+    with other:
+        b = DummyStrategy(currency="USD")
+    mock_env._poller = Mock()
+    mock_env._poller.wait_all.return_value = [Response({"status": "SUCCEEDED"})]
+    other._poller = Mock()
+    other._poller.wait_all.return_value = [Response({"status": "SUCCEEDED"})]
+    sig.gather([a, b])
+    mock_env._poller.wait_all.assert_called_once_with([a.creation_response])
+    other._poller.wait_all.assert_called_once_with([b.creation_response])
+
+
+def test_strategy_submit_error(mock_env, dummy_create):
+    dummy_create.side_effect = ValueError("invalid input")
+    future = DummyStrategy.submit(currency="USD")
+    with pytest.raises(ValueError, match="invalid input"):
+        sig.gather([future])
@@ -6,6 +6,9 @@ import pytest
 from sigtech.api.client.utils import (
     camel_to_snake,
     date_from_iso_format,
+    dict_to_frame,
+    dict_to_series,
+    parse_timestamps,
     removesuffix,
     series_to_dict,
     singular,
@@ -98,3 +101,40 @@ def test_series_to_dict():
         ],
         "$history": [1.0, None, None, None, None, -0.0],
     }
+
+
+def test_dict_to_series():
+    payload = {
+        "$timestamp": ["2000-01-02T00:00:00", "2000-01-01T00:00:00", "2000-01-03"],
+        "$history": [2.0, None, 3.0],
+    }
+    ts = dict_to_series(payload, name="A", index_name="date")
+    assert ts.index.tolist() == list(pd.date_range("2000-01-01", periods=3))
+    assert ts.index.name == "date"
+    assert ts.name == "A"
+    assert ts.dtype.name == "float64"
+    assert pd.isna(ts.iloc[0]) and ts.iloc[1:].tolist() == [2.0, 3.0]
+
+    s = pd.Series([1.0, 2.0], index=pd.date_range("2000-01-01", periods=2))
+    pd.testing.assert_series_equal(
+        dict_to_series(series_to_dict(s)), s, check_freq=False, check_index_type=False
+    )
+
+
+def test_dict_to_frame():
+    payload = {
+        "$timestamp": ["2000-01-01T12:00:00", "2000-01-02T12:00:00"],
+        "$history": [1, 2],
+        "fairRate": [0.5, None],
+        "name": ["a", "b"],
+    }
+    df = dict_to_frame(payload, columns={"$history": "LastPrice"}, index_name="t")
+    assert list(df.columns) == ["LastPrice", "fairRate", "name"]
+    assert df.index.name == "t"
+    assert df["LastPrice"].dtype.name == "float64"
+    assert df["name"].tolist() == ["a", "b"]
+
+
+def test_parse_timestamps_offset():
+    index = parse_timestamps(["2000-01-01T00:00:00+00:00"])
+    assert index[0] == pd.Timestamp("2000-01-01", tz="UTC")